@@ -1,91 +1,67 @@
 
 from bst import BinarySearchTree
+from join import JoinMixin
 
 class AVLNode:
+    __slots__ = ("key", "left", "right", "parent", "size", "height")
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1
         self.height = 1
 
-class AVLTree(BinarySearchTree):
-    def insert(self, key):
-        self.root = self._insert(self.root, key)
-
-    def _insert(self, root, key):
-        if not root:
-            return AVLNode(key)
-        if key < root.key:
-            root.left = self._insert(root.left, key)
-        else:
-            root.right = self._insert(root.right, key)
+class AVLTree(JoinMixin, BinarySearchTree):
+    node_type = AVLNode
 
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-        balance = self.get_balance(root)
-
-        if balance > 1 and key < root.left.key:
-            return self.right_rotate(root)
-        if balance < -1 and key > root.right.key:
-            return self.left_rotate(root)
-        if balance > 1 and key > root.left.key:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
-        if balance < -1 and key < root.right.key:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
+    def insert(self, key):
+        node = self._insert_node(AVLNode(key))
+        self._rebalance(node.parent)
 
-        return root
+    def _build(self, keys, lo, hi, depth):
+        node = super()._build(keys, lo, hi, depth)
+        if node:
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        return node
 
     def delete(self, key):
-        self.root = self._delete(self.root, key)
-
-    def _delete(self, root, key):
-        if not root:
-            return root
-        if key < root.key:
-            root.left = self._delete(root.left, key)
-        elif key > root.key:
-            root.right = self._delete(root.right, key)
-        else:
-            if not root.left:
-                return root.right
-            elif not root.right:
-                return root.left
-            temp = self._min_value_node(root.right)
-            root.key = temp.key
-            root.right = self._delete(root.right, temp.key)
-
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-        balance = self.get_balance(root)
-
-        if balance > 1 and self.get_balance(root.left) >= 0:
-            return self.right_rotate(root)
-        if balance > 1 and self.get_balance(root.left) < 0:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
-        if balance < -1 and self.get_balance(root.right) <= 0:
-            return self.left_rotate(root)
-        if balance < -1 and self.get_balance(root.right) > 0:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
-
-        return root
+        node = self.search(key)
+        if node:
+            self._rebalance(self._remove_node(node))
+
+    def _rebalance(self, node):
+        """Walk up from node, refreshing heights and rotating where unbalanced.
+        Stops at the first subtree whose height comes out unchanged: nothing
+        above it can have moved. After an insert that is at the latest the
+        first rotation, which restores the subtree's old height."""
+        while node:
+            old = node.height
+            lh = node.left.height if node.left else 0
+            rh = node.right.height if node.right else 0
+            node.height = 1 + (lh if lh > rh else rh)
+
+            if lh - rh > 1:
+                if self.get_balance(node.left) < 0:
+                    self.left_rotate(node.left)
+                node = self.right_rotate(node)
+            elif rh - lh > 1:
+                if self.get_balance(node.right) > 0:
+                    self.right_rotate(node.right)
+                node = self.left_rotate(node)
+            if node.height == old:
+                return
+            node = node.parent
 
     def left_rotate(self, z):
-        y = z.right
-        T2 = y.left
-        y.left = z
-        z.right = T2
+        y = super().left_rotate(z)
         z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
         y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
         return y
 
     def right_rotate(self, z):
-        y = z.left
-        T3 = y.right
-        y.right = z
-        z.left = T3
+        y = super().right_rotate(z)
         z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
         y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
         return y
@@ -95,3 +71,29 @@ class AVLTree(BinarySearchTree):
 
     def get_balance(self, root):
         return self.get_height(root.left) - self.get_height(root.right) if root else 0
+
+    def _join(self, l, k, r):
+        hl, hr = self.get_height(l), self.get_height(r)
+        if abs(hl - hr) <= 1:
+            self._link(l, k, r)
+            k.height = 1 + max(hl, hr)
+            return k
+        # hang k, with r (or l) beside it, off the taller tree's spine at the
+        # first node no more than one level taller, then rebalance as for an insert
+        tall, short, h = (l, r, hr) if hl > hr else (r, l, hl)
+        p, c = None, tall
+        while c and c.height > h + 1:
+            p, c = c, (c.right if tall is l else c.left)
+        if tall is l:
+            self._link(c, k, short)
+            p.right = k
+        else:
+            self._link(short, k, c)
+            p.left = k
+        k.parent = p
+        k.height = 1 + max(self.get_height(k.left), self.get_height(k.right))
+        self.root = tall
+        if self.order_stats:
+            self._refresh_sizes(p)
+        self._rebalance(p)
+        return self._take_root()
@@ -0,0 +1,229 @@
+"""
+Benchmarks for the HandsOn11 ordered containers.
+
+    python benchmark.py lookups [n]
+    python benchmark.py workloads --sizes 1000 10000 100000 --out results.json
+
+"workloads" runs sorted, reverse, random, Zipfian and insert/delete-churn
+workloads on BST, AVL and RBT and reports ops/sec, final height, rotation
+and comparison counts and memory per key.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from itertools import accumulate
+
+from bst import BinarySearchTree
+from avl import AVLTree
+from rbt import RedBlackTree
+from blocklist import BlockList
+
+CONTAINERS = {
+    "BST": BinarySearchTree,
+    "AVL": AVLTree,
+    "RBT": RedBlackTree,
+    "BlockList": BlockList,
+}
+TREES = {name: CONTAINERS[name] for name in ("BST", "AVL", "RBT")}
+
+
+def build(cls, keys):
+    tree = cls()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+# ---------- Lookup micro-benchmark ----------
+def bench_lookups(n=100_000, queries=200_000, seed=0):
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)
+    probes = [rng.choice(keys) if rng.random() < 0.5 else rng.randrange(n * 10)
+              for _ in range(queries)]
+    print(f"{'container':10s} {'build s':>9s} {'lookup ns':>10s} {'bytes/key':>10s}")
+    for name, cls in CONTAINERS.items():
+        t0 = time.perf_counter()
+        tree = build(cls, keys)
+        built = time.perf_counter() - t0
+        del tree
+        tracemalloc.start()
+        tree = build(cls, keys)
+        mem, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        search = tree.search
+        t0 = time.perf_counter()
+        for key in probes:
+            search(key)
+        per_lookup = (time.perf_counter() - t0) / queries
+        print(f"{name:10s} {built:9.3f} {per_lookup * 1e9:10.0f} {mem / n:10.1f}")
+
+
+# ---------- Instrumentation ----------
+# The counters live in subclasses / key wrappers that only the harness uses,
+# so the trees themselves pay nothing when they aren't being measured.
+def instrumented(cls):
+    """Subclass of cls that counts calls to left_rotate/right_rotate."""
+    class Counted(cls):
+        rotations = 0
+
+        def left_rotate(self, x):
+            Counted.rotations += 1
+            return super().left_rotate(x)
+
+        def right_rotate(self, x):
+            Counted.rotations += 1
+            return super().right_rotate(x)
+
+    Counted.__name__ = f"Counted{cls.__name__}"
+    return Counted
+
+
+class CountingKey:
+    """Key wrapper that counts how often the tree compares keys."""
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value < other.value
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        CountingKey.comparisons += 1
+        return self.value != other.value
+
+    __hash__ = None
+
+
+def tree_height(root):
+    height, level = 0, [root] if root else []
+    while level:
+        height += 1
+        level = [c for node in level for c in (node.left, node.right) if c]
+    return height
+
+
+# ---------- Workloads: (keys, ops) where ops are (op, key) pairs ----------
+def zipf_ranks(n, count, rng, s=1.1):
+    cum = list(accumulate(1 / (r ** s) for r in range(1, n + 1)))
+    return rng.choices(range(n), cum_weights=cum, k=count)
+
+
+def workload(name, n, rng):
+    if name == "sorted":
+        return [], [("insert", k) for k in range(n)]
+    if name == "reverse":
+        return [], [("insert", k) for k in range(n - 1, -1, -1)]
+    if name == "random":
+        keys = rng.sample(range(n * 10), n)
+        return [], [("insert", k) for k in keys]
+    if name == "zipf":
+        keys = rng.sample(range(n * 10), n)
+        return keys, [("search", keys[r]) for r in zipf_ranks(n, n, rng)]
+    if name == "churn":
+        start = rng.sample(range(n * 10), n)
+        live, ops = list(start), []
+        for _ in range(n):
+            i = rng.randrange(n)
+            ops.append(("delete", live[i]))
+            live[i] = rng.randrange(n * 10)
+            ops.append(("insert", live[i]))
+        return start, ops
+    raise ValueError(f"Unknown workload {name!r}")
+
+
+WORKLOADS = ("sorted", "reverse", "random", "zipf", "churn")
+
+
+def run_ops(tree, ops):
+    insert, delete, search = tree.insert, tree.delete, tree.search
+    for op, key in ops:
+        if op == "insert":
+            insert(key)
+        elif op == "delete":
+            delete(key)
+        else:
+            search(key)
+
+
+def measure(cls, start, ops):
+    """One timed run, one under tracemalloc counting rotations, one counting comparisons."""
+    tree = build(cls, start)
+    t0 = time.perf_counter()
+    run_ops(tree, ops)
+    seconds = time.perf_counter() - t0
+    del tree
+
+    counted = instrumented(cls)
+    tracemalloc.start()
+    tree = build(counted, start)
+    counted.rotations = 0
+    run_ops(tree, ops)
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    height = tree_height(tree.root)
+    size = len(tree.inorder())
+    del tree
+
+    tree = build(cls, [CountingKey(k) for k in start])
+    CountingKey.comparisons = 0
+    run_ops(tree, [(op, CountingKey(k)) for op, k in ops])
+    return {"ops": len(ops), "seconds": seconds, "ops_per_sec": len(ops) / seconds,
+            "height": height, "rotations": counted.rotations,
+            "comparisons": CountingKey.comparisons,
+            "bytes_per_key": mem / max(size, 1)}
+
+
+def bench_workloads(sizes, workloads=WORKLOADS, trees=TREES, seed=0, bst_path_limit=10_000):
+    results = []
+    print(f"{'tree':5s} {'workload':8s} {'n':>9s} {'ops/s':>11s} {'height':>7s} "
+          f"{'rotations':>10s} {'comparisons':>12s} {'bytes/key':>10s}")
+    for n in sizes:
+        for wl in workloads:
+            start, ops = workload(wl, n, random.Random(seed))
+            for name, cls in trees.items():
+                if cls is BinarySearchTree and wl in ("sorted", "reverse") and n > bst_path_limit:
+                    continue  # a plain BST degenerates to a path: quadratic
+                row = {"tree": name, "workload": wl, "n": n, "seed": seed}
+                row.update(measure(cls, start, ops))
+                results.append(row)
+                print(f"{name:5s} {wl:8s} {n:9d} {row['ops_per_sec']:11.0f} {row['height']:7d} "
+                      f"{row['rotations']:10d} {row['comparisons']:12d} {row['bytes_per_key']:10.1f}")
+    return results
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = ap.add_subparsers(dest="command")
+    lk = sub.add_parser("lookups")
+    lk.add_argument("n", type=int, nargs="?", default=100_000)
+    wk = sub.add_parser("workloads")
+    wk.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    wk.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=WORKLOADS)
+    wk.add_argument("--trees", nargs="+", default=list(TREES), choices=list(TREES))
+    wk.add_argument("--seed", type=int, default=0)
+    wk.add_argument("--out")
+    args = ap.parse_args(argv)
+
+    if args.command == "workloads":
+        results = bench_workloads(args.sizes, args.workloads,
+                                  {t: TREES[t] for t in args.trees}, args.seed)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump({"python": sys.version, "results": results}, f, indent=2)
+    else:
+        bench_lookups(getattr(args, "n", 100_000))
+
+
+if __name__ == "__main__":
+    main()
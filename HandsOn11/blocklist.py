@@ -0,0 +1,122 @@
+
+from bisect import bisect_left, bisect_right, insort_right
+
+class BlockList:
+    """
+    Ordered container stored as a list of sorted blocks, with the same
+    insert/search/delete/inorder surface as BinarySearchTree.
+    A lookup is two bisects (block maxima, then inside one block) over
+    contiguous lists instead of a pointer chase per level.
+    """
+
+    def __init__(self, load=512):
+        self.load = load        # blocks split at 2*load, merge below load/2
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    @classmethod
+    def from_sorted(cls, iterable, load=512):
+        tree = cls(load)
+        keys = list(iterable)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("from_sorted needs keys in sorted order.")
+        tree._blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        tree._maxes = [block[-1] for block in tree._blocks]
+        tree._len = len(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, load=512):
+        return cls.from_sorted(sorted(iterable), load)
+
+    def __len__(self):
+        return self._len
+
+    def insert(self, key):
+        blocks, maxes = self._blocks, self._maxes
+        self._len += 1
+        if not blocks:
+            blocks.append([key])
+            maxes.append(key)
+            return
+        i = bisect_right(maxes, key)
+        if i == len(maxes):
+            i -= 1
+            blocks[i].append(key)
+            maxes[i] = key
+        else:
+            insort_right(blocks[i], key)
+        if len(blocks[i]) > 2 * self.load:
+            block = blocks[i]
+            blocks.insert(i + 1, block[self.load:])
+            del block[self.load:]
+            maxes.insert(i, block[-1])
+
+    def search(self, key):
+        """Return the stored key equal to key, or None."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        return block[j] if block[j] == key else None
+
+    def delete(self, key):
+        blocks, maxes = self._blocks, self._maxes
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            return
+        block = blocks[i]
+        j = bisect_left(block, key)
+        if block[j] != key:
+            return
+        del block[j]
+        self._len -= 1
+        if not block:
+            del blocks[i], maxes[i]
+            return
+        maxes[i] = block[-1]
+        if len(block) < self.load // 2 and len(blocks) > 1:
+            # fold into a neighbour, splitting again if that got too big
+            if i == len(blocks) - 1:
+                i -= 1
+            blocks[i].extend(blocks[i + 1])
+            del blocks[i + 1], maxes[i + 1]
+            block = blocks[i]
+            maxes[i] = block[-1]
+            if len(block) > 2 * self.load:
+                half = len(block) // 2
+                blocks.insert(i + 1, block[half:])
+                del block[half:]
+                maxes.insert(i, block[-1])
+
+    def inorder(self):
+        return list(self)
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield keys between lo and hi in order; None leaves that end open."""
+        blocks, maxes = self._blocks, self._maxes
+        if lo is None:
+            i, j = 0, 0
+        else:
+            find = bisect_left if inclusive[0] else bisect_right
+            i = find(maxes, lo)
+            j = find(blocks[i], lo) if i < len(blocks) else 0
+        while i < len(blocks):
+            block = blocks[i]
+            for k in range(j, len(block)):
+                key = block[k]
+                if hi is not None and (hi < key or (not inclusive[1] and key == hi)):
+                    return
+                yield key
+            i, j = i + 1, 0
@@ -1,65 +1,115 @@
 
 class Node:
+    __slots__ = ("key", "left", "right", "parent", "size")
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1
 
 class BinarySearchTree:
-    def __init__(self):
+    node_type = Node
+
+    def __init__(self, order_stats=False):
+        """order_stats=True keeps subtree sizes for select/rank/count_range."""
         self.root = None
+        self.order_stats = order_stats
+
+    @classmethod
+    def from_sorted(cls, iterable, **kwargs):
+        """Build a height-balanced tree from already sorted keys in O(n)."""
+        keys = list(iterable)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("from_sorted needs keys in sorted order.")
+        tree = cls(**kwargs)
+        tree.root = tree._build(keys, 0, len(keys) - 1, 0)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        return cls.from_sorted(sorted(iterable), **kwargs)
+
+    def _build(self, keys, lo, hi, depth):
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self.node_type(keys[mid])
+        node.left = self._build(keys, lo, mid - 1, depth + 1)
+        node.right = self._build(keys, mid + 1, hi, depth + 1)
+        if node.left:
+            node.left.parent = node
+        if node.right:
+            node.right.parent = node
+        node.size = hi - lo + 1
+        return node
 
     def insert(self, key):
-        if not self.root:
-            self.root = Node(key)
-            return
-        self._insert(self.root, key)
-
-    def _insert(self, root, key):
-        if key < root.key:
-            if root.left:
-                self._insert(root.left, key)
-            else:
-                root.left = Node(key)
-                root.left.parent = root
+        self._insert_node(self.node_type(key))
+
+    def _insert_node(self, node):
+        """Attach node as a leaf (equal keys go right) and return it."""
+        parent, cur = None, self.root
+        while cur:
+            parent = cur
+            cur = cur.left if node.key < cur.key else cur.right
+        node.parent = parent
+        if not parent:
+            self.root = node
+        elif node.key < parent.key:
+            parent.left = node
         else:
-            if root.right:
-                self._insert(root.right, key)
-            else:
-                root.right = Node(key)
-                root.right.parent = root
+            parent.right = node
+        if self.order_stats:
+            while parent:
+                parent.size += 1
+                parent = parent.parent
+        return node
 
     def search(self, key):
-        return self._search(self.root, key)
-
-    def _search(self, root, key):
-        if not root or root.key == key:
-            return root
-        if key < root.key:
-            return self._search(root.left, key)
-        else:
-            return self._search(root.right, key)
+        cur = self.root
+        while cur and cur.key != key:
+            cur = cur.left if key < cur.key else cur.right
+        return cur
 
     def delete(self, key):
-        self.root = self._delete(self.root, key)
-
-    def _delete(self, root, key):
-        if not root:
-            return root
-        if key < root.key:
-            root.left = self._delete(root.left, key)
-        elif key > root.key:
-            root.right = self._delete(root.right, key)
+        node = self.search(key)
+        if node:
+            self._remove_node(node)
+
+    def _remove_node(self, node):
+        """Unlink node, returning the parent of the node that was spliced out."""
+        if node.left and node.right:
+            temp = self._min_value_node(node.right)
+            node.key = temp.key
+            node = temp
+        self._transplant(node, node.left or node.right)
+        if self.order_stats:
+            self._refresh_sizes(node.parent)
+        return node.parent
+
+    def _transplant(self, u, v):
+        """Put subtree v where u was."""
+        if not u.parent:
+            self.root = v
+        elif u == u.parent.left:
+            u.parent.left = v
         else:
-            if not root.left:
-                return root.right
-            elif not root.right:
-                return root.left
-            temp = self._min_value_node(root.right)
-            root.key = temp.key
-            root.right = self._delete(root.right, temp.key)
-        return root
+            u.parent.right = v
+        if v:
+            v.parent = u.parent
+
+    def _refresh_sizes(self, node):
+        """Recompute subtree sizes from node up to the root."""
+        while node:
+            node.size = 1 + self._size(node.left) + self._size(node.right)
+            node = node.parent
+
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
 
     def _min_value_node(self, node):
         current = node
@@ -67,8 +117,136 @@ class BinarySearchTree:
             current = current.left
         return current
 
+    def left_rotate(self, x):
+        y = x.right
+        x.right = y.left
+        if y.left:
+            y.left.parent = x
+        y.parent = x.parent
+        if not x.parent:
+            self.root = y
+        elif x == x.parent.left:
+            x.parent.left = y
+        else:
+            x.parent.right = y
+        y.left = x
+        x.parent = y
+        if self.order_stats:
+            y.size = x.size
+            x.size = 1 + self._size(x.left) + self._size(x.right)
+        return y
+
+    def right_rotate(self, x):
+        y = x.left
+        x.left = y.right
+        if y.right:
+            y.right.parent = x
+        y.parent = x.parent
+        if not x.parent:
+            self.root = y
+        elif x == x.parent.right:
+            x.parent.right = y
+        else:
+            x.parent.left = y
+        y.right = x
+        x.parent = y
+        if self.order_stats:
+            y.size = x.size
+            x.size = 1 + self._size(x.left) + self._size(x.right)
+        return y
+
+    # ---------- Order statistics (order_stats=True) ----------
+    def select(self, i):
+        """Return the i-th smallest key (1-based, like quickselect)."""
+        self._need_order_stats()
+        if not 1 <= i <= self._size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            r = self._size(node.left) + 1
+            if i == r:
+                return node.key
+            if i < r:
+                node = node.left
+            else:
+                i -= r
+                node = node.right
+
+    def rank(self, key):
+        """Number of keys <= key (the 1-based position of key if present)."""
+        self._need_order_stats()
+        return self._count_below(key, inclusive=True)
+
+    def count_range(self, lo, hi):
+        """Number of keys k with lo <= k <= hi."""
+        self._need_order_stats()
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+    def _count_below(self, key, inclusive):
+        count, node = 0, self.root
+        while node:
+            if node.key < key or (inclusive and node.key == key):
+                count += self._size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def _need_order_stats(self):
+        if not self.order_stats:
+            raise ValueError("Tree was created without order_stats=True.")
+
+    # ---------- Lazy in-order traversal ----------
     def inorder(self):
-        return self._inorder(self.root)
+        return list(self)
 
-    def _inorder(self, root):
-        return self._inorder(root.left) + [root.key] + self._inorder(root.right) if root else []
+    def __iter__(self):
+        node = self._min_value_node(self.root) if self.root else None
+        while node:
+            yield node.key
+            node = self._successor(node)
+
+    def __reversed__(self):
+        node = self._max_value_node(self.root) if self.root else None
+        while node:
+            yield node.key
+            node = self._predecessor(node)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield keys between lo and hi in order; None leaves that end open.
+        Finding the first key is O(log n), each further key amortised O(1)."""
+        node = self.root
+        start = None
+        while node:
+            if lo is None or lo < node.key or (inclusive[0] and node.key == lo):
+                start = node
+                node = node.left
+            else:
+                node = node.right
+        while start:
+            if hi is not None and (hi < start.key or (not inclusive[1] and start.key == hi)):
+                return
+            yield start.key
+            start = self._successor(start)
+
+    def _successor(self, node):
+        if node.right:
+            return self._min_value_node(node.right)
+        while node.parent and node == node.parent.right:
+            node = node.parent
+        return node.parent
+
+    def _predecessor(self, node):
+        if node.left:
+            return self._max_value_node(node.left)
+        while node.parent and node == node.parent.left:
+            node = node.parent
+        return node.parent
+
+    def _max_value_node(self, node):
+        current = node
+        while current.right:
+            current = current.right
+        return current
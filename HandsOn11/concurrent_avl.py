@@ -0,0 +1,136 @@
+
+import threading
+
+class PathNode:
+    """Immutable AVL node; never changed once it is reachable from a root."""
+    __slots__ = ("key", "left", "right", "height", "size")
+
+    def __init__(self, key, left, right):
+        self.key = key
+        self.left = left
+        self.right = right
+        self.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+def _height(node):
+    return node.height if node else 0
+
+def _balance(key, left, right):
+    """Build a node over left/right, rotating if their heights differ by 2."""
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) >= _height(left.right):
+            return PathNode(left.key, left.left, PathNode(key, left.right, right))
+        lr = left.right
+        return PathNode(lr.key, PathNode(left.key, left.left, lr.left), PathNode(key, lr.right, right))
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) >= _height(right.left):
+            return PathNode(right.key, PathNode(key, left, right.left), right.right)
+        rl = right.left
+        return PathNode(rl.key, PathNode(key, left, rl.left), PathNode(right.key, rl.right, right.right))
+    return PathNode(key, left, right)
+
+def _insert(node, key):
+    if not node:
+        return PathNode(key, None, None)
+    if key < node.key:
+        return _balance(node.key, _insert(node.left, key), node.right)
+    return _balance(node.key, node.left, _insert(node.right, key))
+
+def _delete(node, key):
+    """Returns the new subtree, or node itself when key is absent."""
+    if not node:
+        return None
+    if key < node.key:
+        left = _delete(node.left, key)
+        return node if left is node.left else _balance(node.key, left, node.right)
+    if node.key < key:
+        right = _delete(node.right, key)
+        return node if right is node.right else _balance(node.key, node.left, right)
+    if not node.left:
+        return node.right
+    if not node.right:
+        return node.left
+    succ = node.right
+    while succ.left:
+        succ = succ.left
+    return _balance(succ.key, node.left, _delete_min(node.right))
+
+def _delete_min(node):
+    if not node.left:
+        return node.right
+    return _balance(node.key, _delete_min(node.left), node.right)
+
+class TreeSnapshot:
+    """Read-only view of a ConcurrentAVLTree as of one moment."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def __len__(self):
+        root = self.root
+        return root.size if root else 0
+
+    def search(self, key):
+        """Return the stored key equal to key, or None."""
+        cur = self.root
+        while cur and cur.key != key:
+            cur = cur.left if key < cur.key else cur.right
+        return cur.key if cur else None
+
+    def __iter__(self):
+        return self.irange()
+
+    def inorder(self):
+        return list(self)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield keys between lo and hi in order; None leaves that end open."""
+        stack = []
+        node = self.root
+        while node:                     # stack holds the path to the first key >= lo
+            if lo is None or lo < node.key or (inclusive[0] and node.key == lo):
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if hi is not None and (hi < node.key or (not inclusive[1] and node.key == hi)):
+                return
+            yield node.key
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+
+class ConcurrentAVLTree(TreeSnapshot):
+    """
+    AVL tree safe to share between threads, with non-blocking readers.
+
+    Writers copy the root-to-leaf path they change (O(log n) new nodes)
+    and publish the new root with a single attribute store; they are
+    serialised by a lock. Readers just load the current root and never
+    wait, and snapshot() hands out that root for long iterations that
+    must not see concurrent writes.
+    """
+
+    def __init__(self, keys=()):
+        super().__init__(None)
+        self._write_lock = threading.Lock()
+        for key in keys:
+            self.insert(key)
+
+    def insert(self, key):
+        with self._write_lock:
+            self.root = _insert(self.root, key)
+
+    def delete(self, key):
+        with self._write_lock:
+            self.root = _delete(self.root, key)
+
+    def snapshot(self):
+        return TreeSnapshot(self.root)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        # pin the current root so one scan never mixes two versions
+        return TreeSnapshot(self.root).irange(lo, hi, inclusive)
@@ -0,0 +1,282 @@
+
+import heapq
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right, insort_right
+
+MAGIC = b"HOIDX001"
+WAL_MAGIC = b"HOWAL001"
+HEADER = struct.Struct("<8sIIQQQQ")    # magic, page_size, height, n_keys, root, n_leaves, generation
+PAGE_HEADER = struct.Struct("<I4x")     # number of entries in the page
+WAL_HEADER = struct.Struct("<8sQ")      # magic, generation of the base file it applies to
+WAL_RECORD = struct.Struct("<cq")       # b"+" insert / b"-" delete, key
+KEY = struct.Struct("<q")
+
+class DiskIndex:
+    """
+    Persistent ordered multiset of 64-bit integer keys.
+
+    The base is a static B+-tree in one page-aligned file that is opened
+    with mmap, so a lookup only faults in the root-to-leaf pages it reads
+    and any number of processes can map the same file read-only. Leaves
+    are laid out contiguously (pages 1..n_leaves) so range scans just walk
+    forward. Inserts and deletes are appended to a write-ahead log next to
+    the file and kept in a small in-memory overlay; checkpoint() folds them
+    into a fresh base file, swapped in with os.replace (copy-on-write, so
+    readers holding the old mapping keep a consistent snapshot).
+    Only one process should write at a time.
+    """
+
+    def __init__(self, path, durable=False, readonly=False):
+        self.path = path
+        self.wal_path = path + ".wal"
+        self.durable = durable      # fsync the log after every change
+        self.readonly = readonly    # worker processes: map and read, never write
+        self._added = []            # sorted keys inserted since the base was built
+        self._deleted = {}          # key -> how many base copies are deleted
+        self._open_base()
+        self._replay_wal()
+
+    # ---------- Building and opening ----------
+    @classmethod
+    def create(cls, path, keys=(), page_size=4096, durable=False):
+        """Write a new index holding keys (any order) and open it."""
+        cls._write_base(path, sorted(keys), page_size, generation=0)
+        cls._reset_wal(path + ".wal", 0)
+        return cls(path, durable)
+
+    @staticmethod
+    def _write_base(path, keys, page_size, generation):
+        leaf_cap = (page_size - PAGE_HEADER.size) // KEY.size
+        inner_cap = (page_size - PAGE_HEADER.size) // (2 * KEY.size)
+        if inner_cap < 2:   # inner levels would never shrink
+            raise ValueError(f"page_size must be at least {PAGE_HEADER.size + 4 * KEY.size} bytes.")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(bytes(page_size))           # header page, filled in last
+            page_no = 1
+            level = []                          # (first key, page) of the level below
+            for i in range(0, len(keys), leaf_cap):
+                chunk = keys[i:i + leaf_cap]
+                f.write(DiskIndex._page(page_size, len(chunk), chunk))
+                level.append((chunk[0], page_no))
+                page_no += 1
+            n_leaves = len(level)
+            height = 1 if level else 0
+            while len(level) > 1:
+                upper = []
+                for i in range(0, len(level), inner_cap):
+                    group = level[i:i + inner_cap]
+                    body = [k for k, _ in group] + [0] * (inner_cap - len(group)) + [p for _, p in group]
+                    f.write(DiskIndex._page(page_size, len(group), body))
+                    upper.append((group[0][0], page_no))
+                    page_no += 1
+                level = upper
+                height += 1
+            root = level[0][1] if level else 0
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, page_size, height, len(keys), root, n_leaves, generation))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _page(page_size, count, values):
+        data = PAGE_HEADER.pack(count) + struct.pack(f"<{len(values)}q", *values)
+        return data + bytes(page_size - len(data))
+
+    @staticmethod
+    def _reset_wal(wal_path, generation):
+        with open(wal_path, "wb") as f:
+            f.write(WAL_HEADER.pack(WAL_MAGIC, generation))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _open_base(self):
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.page_size, self.height, self._n_base, self.root, self.n_leaves, \
+            self.generation = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a DiskIndex file.")
+        self._view = memoryview(self._mm)
+        self._inner_cap = (self.page_size - PAGE_HEADER.size) // (2 * KEY.size)
+
+    def _replay_wal(self):
+        try:
+            with open(self.wal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        if len(data) < WAL_HEADER.size or WAL_HEADER.unpack_from(data, 0) != (WAL_MAGIC, self.generation):
+            # missing, or left over from before the last checkpoint
+            if not self.readonly:
+                self._reset_wal(self.wal_path, self.generation)
+            data = b""
+        end = WAL_HEADER.size
+        usable = end + (len(data) - end) // WAL_RECORD.size * WAL_RECORD.size  # drop a torn tail
+        for op, key in WAL_RECORD.iter_unpack(data[end:usable]):
+            if op == b"+":
+                self._apply_insert(key)
+            else:
+                self._apply_delete(key)
+        if self.readonly:
+            self._wal = None
+            return
+        self._wal = open(self.wal_path, "r+b")
+        self._wal.truncate(usable)
+        self._wal.seek(usable)
+
+    def close(self):
+        if self._wal:
+            self._wal.close()
+        self._view.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- Page access ----------
+    def _keys(self, page):
+        """Zero-copy view of the sorted keys stored in a page."""
+        off = page * self.page_size
+        count, = PAGE_HEADER.unpack_from(self._mm, off)
+        start = off + PAGE_HEADER.size
+        return self._view[start:start + count * KEY.size].cast("q")
+
+    def _children(self, page, count):
+        start = page * self.page_size + PAGE_HEADER.size + self._inner_cap * KEY.size
+        return self._view[start:start + count * KEY.size].cast("q")
+
+    def _seek(self, key, strict):
+        """(leaf page, index) of the first base key >= key (> key if strict)."""
+        if not self.root:
+            return 1, 0
+        find = bisect_right if strict else bisect_left
+        page = self.root
+        for _ in range(self.height - 1):
+            seps = self._keys(page)
+            i = max(find(seps, key) - 1, 0)
+            page = self._children(page, len(seps))[i]
+        return page, find(self._keys(page), key)
+
+    def _base_count(self, key):
+        count = 0
+        page, i = self._seek(key, strict=False)
+        while page <= self.n_leaves:
+            keys = self._keys(page)
+            while i < len(keys):
+                if keys[i] != key:
+                    return count
+                count += 1
+                i += 1
+            page, i = page + 1, 0
+        return count
+
+    def _base_range(self, lo, hi, inclusive):
+        """Iterator over base keys, pinned to the current mapping so a later
+        checkpoint neither disturbs it nor is blocked by it."""
+        page, i = (1, 0) if lo is None else self._seek(lo, strict=not inclusive[0])
+        return self._scan(self._mm, self.page_size, self.n_leaves, page, i, hi, inclusive)
+
+    @staticmethod
+    def _scan(mm, page_size, n_leaves, page, i, hi, inclusive):
+        while page <= n_leaves:
+            off = page * page_size
+            count, = PAGE_HEADER.unpack_from(mm, off)
+            # copy the page out: a live memoryview would stop the mmap from closing
+            keys = struct.unpack_from(f"<{count}q", mm, off + PAGE_HEADER.size)
+            for k in range(i, count):
+                key = keys[k]
+                if hi is not None and (hi < key or (not inclusive[1] and key == hi)):
+                    return
+                yield key
+            page, i = page + 1, 0
+
+    # ---------- Ordered-container surface ----------
+    def __len__(self):
+        return self._n_base + len(self._added) - sum(self._deleted.values())
+
+    def search(self, key):
+        """Return key if it is stored, else None."""
+        i = bisect_left(self._added, key)
+        if i < len(self._added) and self._added[i] == key:
+            return key
+        return key if self._base_count(key) > self._deleted.get(key, 0) else None
+
+    def insert(self, key):
+        self._log(b"+", key)
+        self._apply_insert(key)
+
+    def delete(self, key):
+        if self.search(key) is None:
+            return
+        self._log(b"-", key)
+        self._apply_delete(key)
+
+    def _apply_insert(self, key):
+        insort_right(self._added, key)
+
+    def _apply_delete(self, key):
+        i = bisect_left(self._added, key)
+        if i < len(self._added) and self._added[i] == key:
+            del self._added[i]
+        else:
+            self._deleted[key] = self._deleted.get(key, 0) + 1
+
+    def _log(self, op, key):
+        if self.readonly:
+            raise PermissionError("DiskIndex was opened read-only.")
+        self._wal.write(WAL_RECORD.pack(op, key))
+        self._wal.flush()
+        if self.durable:
+            os.fsync(self._wal.fileno())
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield keys between lo and hi in order; None leaves that end open."""
+        base = self._base_range(lo, hi, inclusive)
+        if self._deleted:
+            base = self._skip_deleted(base, dict(self._deleted))
+        if lo is None:
+            i = 0
+        else:
+            i = (bisect_left if inclusive[0] else bisect_right)(self._added, lo)
+        if hi is None:
+            j = len(self._added)
+        else:
+            j = (bisect_right if inclusive[1] else bisect_left)(self._added, hi)
+        return heapq.merge(base, self._added[i:j])
+
+    @staticmethod
+    def _skip_deleted(keys, pending):
+        for key in keys:
+            if pending.get(key):
+                pending[key] -= 1
+            else:
+                yield key
+
+    def __iter__(self):
+        return self.irange()
+
+    def inorder(self):
+        return list(self)
+
+    def checkpoint(self):
+        """Fold the log into a new base file and start an empty log."""
+        if self.readonly:
+            raise PermissionError("DiskIndex was opened read-only.")
+        keys = self.inorder()
+        generation = self.generation + 1
+        self._write_base(self.path, keys, self.page_size, generation)
+        self._reset_wal(self.wal_path, generation)
+        self._wal.close()
+        # Drop the old mapping without closing it: iterators started before
+        # the checkpoint still read it, and it is unmapped once they finish.
+        self._view.release()
+        self._added, self._deleted = [], {}
+        self._open_base()
+        self._replay_wal()
@@ -0,0 +1,140 @@
+class JoinMixin:
+    """
+    Join-based split/join/union/intersection/difference for balanced trees.
+
+    These consume their input trees and relink the existing nodes, so a
+    merge costs O(m log(n/m + 1)) instead of m separate inserts.
+    union/intersection/difference treat each tree as a set of distinct keys.
+    The helpers recurse once per level, so only self-balancing trees mix
+    this in (a plain BST can be a path of any depth). Subclasses provide
+    _join(l, k, r): join detached subtrees around the detached node k.
+    """
+
+    def split(self, key):
+        """Split into (keys < key, keys >= key); self is left empty."""
+        left, right = self._new_like(), self._new_like()
+        l, r = self._split2(self._take_root(), key)
+        left.root, right.root = l, r
+        return left, right
+
+    @classmethod
+    def join(cls, left, key, right):
+        """Tree of left's keys, key and right's keys; needs left <= key <= right."""
+        if type(left) is not cls:
+            raise TypeError(f"Cannot join {type(left).__name__} trees with {cls.__name__}.join.")
+        tree = left._new_like(right)
+        if (left.root and key < left._max_value_node(left.root).key) or \
+                (right.root and right._min_value_node(right.root).key < key):
+            raise ValueError("join needs max(left) <= key <= min(right).")
+        tree.root = tree._join(left._take_root(), tree.node_type(key), right._take_root())
+        right.root = None
+        return tree
+
+    def union(self, other):
+        tree = self._new_like(other)
+        tree.root = tree._union(self._take_root(), other._take_root())
+        return tree
+
+    def intersection(self, other):
+        tree = self._new_like(other)
+        tree.root = tree._intersection(self._take_root(), other._take_root())
+        return tree
+
+    def difference(self, other):
+        tree = self._new_like(other)
+        tree.root = tree._difference(self._take_root(), other._take_root())
+        return tree
+
+    def _new_like(self, other=None):
+        if other is not None:
+            if type(other) is not type(self):
+                raise TypeError(f"Cannot combine {type(self).__name__} with {type(other).__name__}.")
+            if other.order_stats != self.order_stats:
+                raise ValueError("Both trees must agree on order_stats.")
+        return type(self)(order_stats=self.order_stats)
+
+    def _take_root(self):
+        root, self.root = self.root, None
+        return root
+
+    @staticmethod
+    def _detach(node):
+        """Cut node loose from its parent and children; returns the children."""
+        l, r = node.left, node.right
+        node.left = node.right = node.parent = None
+        if l:
+            l.parent = None
+        if r:
+            r.parent = None
+        return l, r
+
+    def _link(self, l, k, r):
+        k.left, k.right = l, r
+        if l:
+            l.parent = k
+        if r:
+            r.parent = k
+        k.size = 1 + self._size(l) + self._size(r)
+        return k
+
+    def _join2(self, l, r):
+        if not l:
+            return r
+        if not r:
+            return l
+        l, k = self._split_last(l)
+        return self._join(l, k, r)
+
+    def _split_last(self, t):
+        l, r = self._detach(t)
+        if not r:
+            return l, t
+        r, last = self._split_last(r)
+        return self._join(l, t, r), last
+
+    def _split2(self, t, key):
+        if not t:
+            return None, None
+        l, r = self._detach(t)
+        if key <= t.key:
+            ll, lr = self._split2(l, key)
+            return ll, self._join(lr, t, r)
+        rl, rr = self._split2(r, key)
+        return self._join(l, t, rl), rr
+
+    def _split3(self, t, key):
+        """(keys < key, node holding key or None, keys > key)."""
+        if not t:
+            return None, None, None
+        l, r = self._detach(t)
+        if key < t.key:
+            ll, m, lr = self._split3(l, key)
+            return ll, m, self._join(lr, t, r)
+        if t.key < key:
+            rl, m, rr = self._split3(r, key)
+            return self._join(l, t, rl), m, rr
+        return l, t, r
+
+    def _union(self, a, b):
+        if not a:
+            return b
+        if not b:
+            return a
+        bl, br = self._detach(b)
+        al, _, ar = self._split3(a, b.key)
+        return self._join(self._union(al, bl), b, self._union(ar, br))
+
+    def _intersection(self, a, b):
+        if not a or not b:
+            return None
+        bl, br = self._detach(b)
+        al, m, ar = self._split3(a, b.key)
+        left, right = self._intersection(al, bl), self._intersection(ar, br)
+        return self._join(left, b, right) if m else self._join2(left, right)
+
+    def _difference(self, a, b):
+        if not a or not b:
+            return a
+        bl, br = self._detach(b)
+        al, _, ar = self._split3(a, b.key)
+        return self._join2(self._difference(al, bl), self._difference(ar, br))
@@ -1,109 +1,240 @@
 
 from bst import BinarySearchTree
+from join import JoinMixin
+
+RED, BLACK = True, False
 
 class RBNode:
+    # bh (black height) is only kept up to date on the roots of the pieces
+    # that split/join pass around
+    __slots__ = ("key", "left", "right", "parent", "size", "color", "bh")
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
         self.parent = None
-        self.color = 'red'
+        self.size = 1
+        self.color = RED
+        self.bh = 0
+
+class RedBlackTree(JoinMixin, BinarySearchTree):
+    node_type = RBNode
 
-class RedBlackTree(BinarySearchTree):
     def insert(self, key):
-        new_node = RBNode(key)
-        self.root = self._bst_insert(self.root, new_node)
+        new_node = self._insert_node(RBNode(key))
         self._fix_insert(new_node)
 
-    def _bst_insert(self, root, node):
-        if not root:
-            return node
-        if node.key < root.key:
-            root.left = self._bst_insert(root.left, node)
-            root.left.parent = root
-        else:
-            root.right = self._bst_insert(root.right, node)
-            root.right.parent = root
-        return root
+    def _build(self, keys, lo, hi, depth):
+        # The balanced build leaves every empty link on the last two levels,
+        # so painting only the deepest level red (when it isn't full) gives
+        # every path the same black height.
+        node = super()._build(keys, lo, hi, depth)
+        if node:
+            n = len(keys)
+            full = (n + 1) & n == 0
+            node.color = RED if not full and depth == n.bit_length() - 1 else BLACK
+        return node
 
     def _fix_insert(self, k):
-        while k != self.root and k.parent.color == 'red':
+        while k != self.root and k.parent.color == RED:
             if k.parent == k.parent.parent.left:
                 u = k.parent.parent.right
-                if u and u.color == 'red':
-                    k.parent.color = 'black'
-                    u.color = 'black'
-                    k.parent.parent.color = 'red'
+                if u and u.color == RED:
+                    k.parent.color = BLACK
+                    u.color = BLACK
+                    k.parent.parent.color = RED
                     k = k.parent.parent
                 else:
                     if k == k.parent.right:
                         k = k.parent
                         self.left_rotate(k)
-                    k.parent.color = 'black'
-                    k.parent.parent.color = 'red'
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     self.right_rotate(k.parent.parent)
             else:
                 u = k.parent.parent.left
-                if u and u.color == 'red':
-                    k.parent.color = 'black'
-                    u.color = 'black'
-                    k.parent.parent.color = 'red'
+                if u and u.color == RED:
+                    k.parent.color = BLACK
+                    u.color = BLACK
+                    k.parent.parent.color = RED
                     k = k.parent.parent
                 else:
                     if k == k.parent.left:
                         k = k.parent
                         self.right_rotate(k)
-                    k.parent.color = 'black'
-                    k.parent.parent.color = 'red'
+                    k.parent.color = BLACK
+                    k.parent.parent.color = RED
                     self.left_rotate(k.parent.parent)
-        self.root.color = 'black'
+        grew = self.root.color == RED      # tree black height went up by one
+        self.root.color = BLACK
+        return grew
 
     def delete(self, key):
-        self.root = self._delete(self.root, key)
-
-    def _delete(self, root, key):
-        if not root:
-            return root
-        if key < root.key:
-            root.left = self._delete(root.left, key)
-        elif key > root.key:
-            root.right = self._delete(root.right, key)
+        z = self.search(key)
+        if z:
+            self._delete_node(z)
+
+    def _delete_node(self, z):
+        """CLRS RB-DELETE; returns the parent of the spot the fix-up started from."""
+        y = z
+        y_color = y.color
+        if not z.left:
+            x, x_parent = z.right, z.parent
+            self._transplant(z, z.right)
+        elif not z.right:
+            x, x_parent = z.left, z.parent
+            self._transplant(z, z.left)
         else:
-            if not root.left:
-                return root.right
-            elif not root.right:
-                return root.left
-            temp = self._min_value_node(root.right)
-            root.key = temp.key
-            root.right = self._delete(root.right, temp.key)
+            y = self._min_value_node(z.right)
+            y_color = y.color
+            x = y.right
+            if y.parent == z:
+                x_parent = y
+            else:
+                x_parent = y.parent
+                self._transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self._transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.color = z.color
+        if self.order_stats:
+            self._refresh_sizes(x_parent)
+        if y_color == BLACK:
+            self._fix_delete(x, x_parent)
+        return x_parent
+
+    def _fix_delete(self, x, parent):
+        # x may be None (an empty leaf), so its parent is tracked separately
+        while x != self.root and (not x or x.color == BLACK):
+            if x == parent.left:
+                w = parent.right
+                if w.color == RED:
+                    w.color = BLACK
+                    parent.color = RED
+                    self.left_rotate(parent)
+                    w = parent.right
+                if (not w.left or w.left.color == BLACK) and (not w.right or w.right.color == BLACK):
+                    w.color = RED
+                    x = parent
+                    parent = x.parent
+                else:
+                    if not w.right or w.right.color == BLACK:
+                        w.left.color = BLACK
+                        w.color = RED
+                        self.right_rotate(w)
+                        w = parent.right
+                    w.color = parent.color
+                    parent.color = BLACK
+                    w.right.color = BLACK
+                    self.left_rotate(parent)
+                    x = self.root
+            else:
+                w = parent.left
+                if w.color == RED:
+                    w.color = BLACK
+                    parent.color = RED
+                    self.right_rotate(parent)
+                    w = parent.left
+                if (not w.right or w.right.color == BLACK) and (not w.left or w.left.color == BLACK):
+                    w.color = RED
+                    x = parent
+                    parent = x.parent
+                else:
+                    if not w.left or w.left.color == BLACK:
+                        w.right.color = BLACK
+                        w.color = RED
+                        self.left_rotate(w)
+                        w = parent.left
+                    w.color = parent.color
+                    parent.color = BLACK
+                    w.left.color = BLACK
+                    self.right_rotate(parent)
+                    x = self.root
+        if x:
+            x.color = BLACK
+
+    def validate(self):
+        """Check parent links, key order, red-red and black-height rules.
+        Returns the black height; raises ValueError on the first violation."""
+        if self.root and (self.root.parent or self.root.color != BLACK):
+            raise ValueError("Root must be black and parentless.")
+
+        def walk(node):
+            if not node:
+                return 1
+            for child in (node.left, node.right):
+                if child and child.parent is not node:
+                    raise ValueError(f"Stale parent link under {node.key!r}.")
+                if child and child.color == RED and node.color == RED:
+                    raise ValueError(f"Red node {child.key!r} has a red parent.")
+            if node.left and node.key < node.left.key or node.right and node.right.key < node.key:
+                raise ValueError(f"Keys out of order at {node.key!r}.")
+            lb, rb = walk(node.left), walk(node.right)
+            if lb != rb:
+                raise ValueError(f"Black heights differ under {node.key!r}.")
+            return lb + (node.color == BLACK)
+
+        return walk(self.root)
+
+    # Join pieces carry their black height in root.bh: it is measured once
+    # when a whole tree is taken apart, derived for children in _detach and
+    # computed by _join, so no join has to walk a spine to find it.
+    def _take_root(self):
+        root = super()._take_root()
+        if root:
+            root.bh = self._black_height(root)
         return root
 
-    def left_rotate(self, x):
-        y = x.right
-        x.right = y.left
-        if y.left:
-            y.left.parent = x
-        y.parent = x.parent
-        if not x.parent:
-            self.root = y
-        elif x == x.parent.left:
-            x.parent.left = y
-        else:
-            x.parent.right = y
-        y.left = x
-        x.parent = y
-
-    def right_rotate(self, x):
-        y = x.left
-        x.left = y.right
-        if y.right:
-            y.right.parent = x
-        y.parent = x.parent
-        if not x.parent:
-            self.root = y
-        elif x == x.parent.right:
-            x.parent.right = y
+    def _detach(self, node):
+        l, r = super()._detach(node)
+        bh = node.bh - (node.color == BLACK)
+        for child in (l, r):
+            if child:
+                child.bh = bh
+        return l, r
+
+    def _join(self, l, k, r):
+        # roots of the pieces may be red; blacken them so black heights compare
+        for t in (l, r):
+            if t and t.color == RED:
+                t.color = BLACK
+                t.bh += 1
+        bl, br = l.bh if l else 0, r.bh if r else 0
+        if bl == br:
+            self._link(l, k, r)
+            k.color = BLACK
+            k.bh = bl + 1
+            return k
+        # walk the taller tree's spine to a black node of the shorter tree's
+        # black height, hang red k there and repair like an insert
+        tall, short, h = (l, r, br) if bl > br else (r, l, bl)
+        p, y, cur = None, tall, max(bl, br)
+        while y and (y.color == RED or cur > h):
+            cur -= y.color == BLACK
+            p, y = y, (y.right if tall is l else y.left)
+        if tall is l:
+            self._link(y, k, short)
+            p.right = k
         else:
-            x.parent.left = y
-        y.right = x
-        x.parent = y
+            self._link(short, k, y)
+            p.left = k
+        k.parent = p
+        k.color = RED
+        self.root = tall
+        if self.order_stats:
+            self._refresh_sizes(p)
+        grew = self._fix_insert(k)
+        root, self.root = self.root, None
+        root.bh = max(bl, br) + grew
+        return root
+
+    @staticmethod
+    def _black_height(node):
+        h = 0
+        while node:
+            h += node.color == BLACK
+            node = node.left
+        return h
@@ -1,7 +1,14 @@
 
 from bst import BinarySearchTree
 from avl import AVLTree
-from rbt import RedBlackTree
+from rbt import RedBlackTree, RED, BLACK
+from blocklist import BlockList
+from diskindex import DiskIndex
+from concurrent_avl import ConcurrentAVLTree
+import os
+import random
+import tempfile
+import threading
 
 def test_bst():
     bst = BinarySearchTree()
@@ -36,7 +43,296 @@ def test_rbt():
     assert rbt.inorder() == [5, 10, 15, 25, 30, 35]
     print("RBT tests passed.")
 
+def test_blocklist():
+    blocks = BlockList(load=2)
+    for key in [20, 10, 30, 5, 15, 25, 35]:
+        blocks.insert(key)
+    assert blocks.inorder() == [5, 10, 15, 20, 25, 30, 35]
+    assert blocks.search(15) is not None
+    assert blocks.search(100) is None
+    blocks.delete(20)
+    assert blocks.inorder() == [5, 10, 15, 25, 30, 35]
+    print("BlockList tests passed.")
+
+def test_deep_and_random():
+    # sorted input degenerates a plain BST into a 20k-long path
+    bst = BinarySearchTree()
+    for key in range(20000):
+        bst.insert(key)
+    assert bst.search(19999).key == 19999
+    for key in range(0, 20000, 2):
+        bst.delete(key)
+    assert bst.search(2) is None and bst.search(3).key == 3
+
+    rng = random.Random(11)
+    for cls in (BinarySearchTree, AVLTree, RedBlackTree, lambda: BlockList(load=4)):
+        tree, keys = cls(), []
+        for _ in range(3000):
+            key = rng.randrange(500)
+            if rng.random() < 0.6:
+                tree.insert(key)
+                keys.append(key)
+            elif key in keys:
+                tree.delete(key)
+                keys.remove(key)
+        assert tree.inorder() == sorted(keys), cls
+    print("Deep/random tests passed.")
+
+def test_bulk_load():
+    def check(node, parent=None):
+        """Returns (height, black height) and checks links, AVL heights and RB colours."""
+        if not node:
+            return 0, 1
+        assert node.parent is parent
+        lh, lb = check(node.left, node)
+        rh, rb = check(node.right, node)
+        assert abs(lh - rh) <= 1 and lb == rb
+        if hasattr(node, "height"):
+            assert node.height == 1 + max(lh, rh)
+        if hasattr(node, "color"):
+            assert not (node.color == RED and node.parent and node.parent.color == RED)
+            return 1 + max(lh, rh), lb + (node.color == BLACK)
+        return 1 + max(lh, rh), lb
+
+    for n in (0, 1, 2, 3, 7, 8, 100, 1023, 1500):
+        keys = list(range(n))
+        for cls in (AVLTree, RedBlackTree):
+            tree = cls.from_iterable(reversed(keys))
+            check(tree.root)
+            assert tree.inorder() == keys
+            if cls is RedBlackTree and tree.root:
+                assert tree.root.color == BLACK
+            tree.insert(n // 2)
+            tree.delete(n - 1)
+            assert tree.inorder() == sorted(keys[:-1] + [n // 2])
+    try:
+        AVLTree.from_sorted([2, 1])
+        assert False, "unsorted input accepted"
+    except ValueError:
+        pass
+    print("Bulk-load tests passed.")
+
+def test_rbt_churn():
+    rng = random.Random(5)
+    rbt, keys = RedBlackTree(), []
+    for step in range(20000):
+        if keys and rng.random() < 0.5:
+            key = keys.pop(rng.randrange(len(keys)))
+            rbt.delete(key)
+        else:
+            key = rng.randrange(10000)
+            rbt.insert(key)
+            keys.append(key)
+        if step % 500 == 0:
+            rbt.validate()
+    black_height = rbt.validate()
+    assert rbt.inorder() == sorted(keys)
+    assert black_height <= len(keys).bit_length() + 1
+
+    rbt.root.color = RED
+    try:
+        rbt.validate()
+        assert False, "red root not reported"
+    except ValueError:
+        pass
+    print("RBT churn tests passed.")
+
+def test_order_stats():
+    rng = random.Random(8)
+    for cls in (AVLTree, RedBlackTree):
+        tree, keys = cls(order_stats=True), []
+        for _ in range(4000):
+            key = rng.randrange(300)
+            if keys and rng.random() < 0.4:
+                key = rng.choice(keys)
+                tree.delete(key)
+                keys.remove(key)
+            else:
+                tree.insert(key)
+                keys.append(key)
+        keys.sort()
+        assert [tree.select(i) for i in range(1, len(keys) + 1)] == keys
+        for key in range(-1, 302, 7):
+            assert tree.rank(key) == sum(k <= key for k in keys)
+            assert tree.count_range(key, key + 40) == sum(key <= k <= key + 40 for k in keys)
+        assert tree.count_range(5, 4) == 0
+
+        bulk = cls.from_iterable(keys, order_stats=True)
+        bulk.insert(150)
+        assert bulk.select(len(keys) // 2 + 1) == sorted(keys + [150])[len(keys) // 2]
+    try:
+        AVLTree().select(1)
+        assert False, "select without sizes"
+    except ValueError:
+        pass
+    print("Order-statistic tests passed.")
+
+def test_iterators():
+    rng = random.Random(3)
+    keys = [rng.randrange(1000) for _ in range(2000)]
+    for cls in (BinarySearchTree, AVLTree, RedBlackTree, lambda: BlockList(load=16)):
+        tree = cls()
+        for key in keys:
+            tree.insert(key)
+        assert list(tree) == sorted(keys)
+        assert list(reversed(tree)) == sorted(keys, reverse=True)
+        for lo, hi in ((None, None), (100, 200), (-5, 3), (990, None), (None, 0), (50, 40)):
+            for inc in ((True, True), (False, False), (True, False)):
+                expect = [k for k in sorted(keys)
+                          if (lo is None or lo < k or inc[0] and k == lo)
+                          and (hi is None or k < hi or inc[1] and k == hi)]
+                assert list(tree.irange(lo, hi, inclusive=inc)) == expect, (cls, lo, hi, inc)
+    assert list(BinarySearchTree()) == []
+
+    # a sorted-input BST is one long path; iteration must not recurse
+    bst = BinarySearchTree()
+    for key in range(20000):
+        bst.insert(key)
+    assert bst.inorder() == list(range(20000))
+    page = bst.irange(12345, None)
+    assert [next(page) for _ in range(3)] == [12345, 12346, 12347]
+    print("Iterator tests passed.")
+
+def test_disk_index():
+    rng = random.Random(4)
+    keys = [rng.randrange(500) for _ in range(2000)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.db")
+        # 64-byte pages: 7 keys per leaf, 3 children per inner page -> several levels
+        with DiskIndex.create(path, keys, page_size=64) as index:
+            assert index.inorder() == sorted(keys)
+            for _ in range(500):
+                key = rng.randrange(520)
+                if rng.random() < 0.5:
+                    index.insert(key)
+                    keys.append(key)
+                elif key in keys:
+                    index.delete(key)
+                    keys.remove(key)
+            assert index.inorder() == sorted(keys)
+        with DiskIndex(path) as index:              # replays the log
+            assert index.inorder() == sorted(keys) and len(index) == len(keys)
+            assert list(index.irange(100, 120, inclusive=(False, True))) == \
+                sorted(k for k in keys if 100 < k <= 120)
+            assert index.search(keys[0]) == keys[0] and index.search(10 ** 6) is None
+            index.checkpoint()
+            assert os.path.getsize(path + ".wal") == 16 and index.inorder() == sorted(keys)
+            index.delete(keys[0])
+            keys.remove(keys[0])
+        with DiskIndex(path, readonly=True) as index:
+            assert index.inorder() == sorted(keys)
+            try:
+                index.insert(1)
+                assert False, "read-only index accepted a write"
+            except PermissionError:
+                pass
+        with DiskIndex.create(path) as index:
+            assert index.inorder() == [] and index.search(1) is None
+        # a paginated read survives a checkpoint and still sees its own snapshot
+        with DiskIndex.create(path, range(100), page_size=64) as index:
+            index.insert(1000)
+            page = index.irange(10)
+            assert next(page) == 10
+            index.checkpoint()
+            index.insert(500)
+            assert list(page) == list(range(11, 100)) + [1000]
+            assert index.inorder() == list(range(100)) + [500, 1000]
+        try:
+            DiskIndex.create(path, range(100), page_size=32)
+            assert False, "accepted a page too small for inner nodes"
+        except ValueError:
+            pass
+    print("DiskIndex tests passed.")
+
+def test_concurrent_avl():
+    tree = ConcurrentAVLTree([20, 10, 30, 5, 15, 25, 35])
+    frozen = tree.snapshot()
+    tree.delete(20)
+    tree.insert(12)
+    assert frozen.inorder() == [5, 10, 15, 20, 25, 30, 35]
+    assert tree.inorder() == [5, 10, 12, 15, 25, 30, 35]
+    assert tree.search(12) == 12 and tree.search(20) is None
+    assert list(tree.irange(10, 25, inclusive=(False, True))) == [12, 15, 25]
+
+    # readers iterate snapshots while two writers each add one key, then drop one
+    tree = ConcurrentAVLTree(range(0, 4000, 2))
+    errors = []
+
+    def writer(offset):
+        for key in range(offset, 4000, 4):
+            tree.insert(key + 1)
+            tree.delete(key)
+
+    def reader():
+        for _ in range(20):
+            snap = tree.snapshot()
+            keys = snap.inorder()
+            if keys != sorted(keys) or len(keys) != len(snap) or not 2000 <= len(keys) <= 2002:
+                errors.append(len(keys))
+
+    threads = [threading.Thread(target=writer, args=(o,)) for o in (0, 2)]
+    threads += [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+    assert tree.inorder() == list(range(1, 4000, 2))
+    print("Concurrent AVL tests passed.")
+
+def test_join_set_ops():
+    rng = random.Random(12)
+    for cls in (AVLTree, RedBlackTree):
+        for _ in range(200):
+            a = set(rng.sample(range(400), rng.randrange(150)))
+            b = set(rng.sample(range(400), rng.randrange(150)))
+            for op, expect in (("union", a | b), ("intersection", a & b), ("difference", a - b)):
+                left = cls.from_iterable(a, order_stats=True)
+                right = cls(order_stats=True)
+                for key in b:
+                    right.insert(key)
+                result = getattr(left, op)(right)
+                assert result.inorder() == sorted(expect), (cls, op)
+                assert left.root is None and right.root is None
+                if expect:
+                    assert result.select(1) == min(expect)
+                if cls is RedBlackTree:
+                    result.validate()
+
+        tree = cls.from_iterable(range(100))
+        lo, hi = tree.split(40)
+        assert lo.inorder() == list(range(40)) and hi.inorder() == list(range(40, 100))
+        joined = cls.join(hi, 150, cls.from_iterable(range(200, 210)))
+        assert joined.inorder() == list(range(40, 100)) + [150] + list(range(200, 210))
+        try:
+            cls.join(cls.from_iterable([5]), 1, cls())
+            assert False, "out-of-order join accepted"
+        except ValueError:
+            pass
+        for bad, err in ((lambda: cls.join(cls.from_iterable([1], order_stats=True), 5,
+                                           cls.from_iterable([9])), ValueError),
+                         (lambda: cls.from_iterable([1]).union(
+                             (RedBlackTree if cls is AVLTree else AVLTree).from_iterable([2])), TypeError)):
+            try:
+                bad()
+                assert False, "mismatched trees combined"
+            except err:
+                pass
+
+    # a plain BST may be a path; the recursive join helpers are not offered on it
+    assert not hasattr(BinarySearchTree(), "split")
+    print("Join/set-operation tests passed.")
+
 if __name__ == "__main__":
     test_bst()
     test_avl()
     test_rbt()
+    test_blocklist()
+    test_deep_and_random()
+    test_bulk_load()
+    test_rbt_churn()
+    test_order_stats()
+    test_iterators()
+    test_disk_index()
+    test_concurrent_avl()
+    test_join_set_ops()
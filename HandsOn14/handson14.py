@@ -1,4 +1,12 @@
+import heapq
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 def topological_sort(edges):
     """
@@ -30,6 +38,147 @@ def topological_sort(edges):
     return order
 
 
+def topological_levels(edges, nodes=()):
+    """
+    Kahn’s algorithm, one antichain at a time.
+    edges: iterable of (u, v) tuples for directed edge u -> v
+    nodes: extra (e.g. isolated) vertices to include
+    returns: list of levels; nodes in a level have no edges between them
+             and depend only on earlier levels
+    """
+    adj = defaultdict(list)
+    indeg = defaultdict(int)
+    for n in nodes:
+        indeg.setdefault(n, 0)
+    for u, v in edges:
+        adj[u].append(v)
+        indeg[v] += 1
+        indeg.setdefault(u, 0)
+
+    level = [v for v, d in indeg.items() if d == 0]
+    levels, seen = [], 0
+    while level:
+        levels.append(level)
+        seen += len(level)
+        nxt = []
+        for u in level:
+            for v in adj[u]:
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    nxt.append(v)
+        level = nxt
+
+    if seen != len(indeg):
+        raise ValueError("Graph is not a DAG.")
+    return levels
+
+
+class TopologicalScheduler:
+    """
+    Ready-set view of a DAG for running jobs on a worker pool:
+    get_ready() hands out every node whose dependencies are all done,
+    mark_done(node) releases its successors.
+    """
+
+    def __init__(self, edges, nodes=()):
+        self.adj = defaultdict(list)
+        self.indeg = defaultdict(int)
+        for n in nodes:
+            self.indeg.setdefault(n, 0)
+        for u, v in edges:
+            self.adj[u].append(v)
+            self.indeg[v] += 1
+            self.indeg.setdefault(u, 0)
+        self._ready = [v for v, d in self.indeg.items() if d == 0]
+        self._running = set()
+        self._left = len(self.indeg)
+        if not self._ready and self._left:
+            raise ValueError("Graph is not a DAG.")
+
+    def get_ready(self):
+        ready, self._ready = self._ready, []
+        self._running.update(ready)
+        return ready
+
+    def mark_done(self, node):
+        if node not in self._running:
+            raise ValueError(f"{node!r} was not handed out by get_ready().")
+        self._running.remove(node)
+        self._left -= 1
+        for v in self.adj[node]:
+            self.indeg[v] -= 1
+            if self.indeg[v] == 0:
+                self._ready.append(v)
+        if not self._ready and not self._running and self._left:
+            raise ValueError("Graph is not a DAG.")
+
+    def is_active(self):
+        return self._left > 0
+
+
+class IncrementalDAG:
+    """
+    DAG that keeps a topological order under edge insertions
+    (Pearce–Kelly): an edge that already agrees with the order costs O(1),
+    otherwise only the vertices between its endpoints are reordered.
+    """
+
+    def __init__(self, edges=(), nodes=()):
+        self.succ = defaultdict(set)
+        self.pred = defaultdict(set)
+        self.pos = {}
+        self._order = []
+        for n in nodes:
+            self.add_node(n)
+        for u, v in edges:
+            self.add_edge(u, v)
+
+    def add_node(self, n):
+        if n not in self.pos:
+            self.pos[n] = len(self._order)
+            self._order.append(n)
+
+    def add_edge(self, u, v):
+        """Add u -> v; raises ValueError (and changes nothing) on a cycle."""
+        self.add_node(u)
+        self.add_node(v)
+        lo, hi = self.pos[v], self.pos[u]
+        if u == v:
+            raise ValueError("Edge would create a cycle.")
+        if lo > hi:
+            self.succ[u].add(v)
+            self.pred[v].add(u)
+            return
+        forward = self._reach(v, self.succ, lambda x: self.pos[x] <= hi)
+        if u in forward:
+            raise ValueError("Edge would create a cycle.")
+        backward = self._reach(u, self.pred, lambda x: self.pos[x] >= lo)
+        self.succ[u].add(v)
+        self.pred[v].add(u)
+
+        by_pos = self.pos.__getitem__
+        moved = sorted(backward, key=by_pos) + sorted(forward, key=by_pos)
+        slots = sorted(self.pos[x] for x in moved)
+        for x, i in zip(moved, slots):
+            self.pos[x] = i
+            self._order[i] = x
+
+    @staticmethod
+    def _reach(start, nbrs, inside):
+        seen = {start}
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            for y in nbrs[x]:
+                if y not in seen and inside(y):
+                    seen.add(y)
+                    stack.append(y)
+        return seen
+
+    def order(self):
+        return list(self._order)
+
+
 def depth_first_search(graph):
     """
     Classic DFS for a directed graph.
@@ -37,31 +186,59 @@ def depth_first_search(graph):
     graph: dict {vertex: [adjacent vertices]}
     returns: discovery_times, finishing_times, parents, finished_order
     """
-    time = 0
-    color = {}
     d_time, f_time, parent = {}, {}, {}
     finished = []
+    for kind, u, x in dfs_events(graph):
+        if kind == "discover":
+            d_time[u] = x
+            parent.setdefault(u, None)
+        elif kind == "tree":
+            parent[x] = u
+        elif kind == "finish":
+            f_time[u] = x
+            finished.append(u)
+    return d_time, f_time, parent, finished
 
-    def visit(u):
-        nonlocal time
-        color[u] = "gray"
-        time += 1
-        d_time[u] = time
-        for v in graph[u]:
-            if color.get(v, "white") == "white":
-                parent[v] = u
-                visit(v)
-        color[u] = "black"
-        time += 1
-        f_time[u] = time
-        finished.append(u)
 
-    for u in graph:
-        if color.get(u, "white") == "white":
-            parent[u] = None
-            visit(u)
+def dfs_events(graph):
+    """
+    Iterative DFS that streams what it sees, so callers can stop early.
 
-    return d_time, f_time, parent, finished
+    graph: dict {vertex: [adjacent vertices]}
+    yields: ("discover", u, time), ("finish", u, time), and
+            ("tree" | "back" | "forward" | "cross", u, v) for each edge u -> v
+    """
+    time = 0
+    d_time = {}
+    done = set()
+    for root in graph:
+        if root in d_time:
+            continue
+        time += 1
+        d_time[root] = time
+        yield "discover", root, time
+        stack = [(root, iter(graph.get(root, ())))]
+        while stack:
+            u, it = stack[-1]
+            for v in it:
+                if v not in d_time:
+                    yield "tree", u, v
+                    time += 1
+                    d_time[v] = time
+                    yield "discover", v, time
+                    stack.append((v, iter(graph.get(v, ()))))
+                    break
+                if v not in done:
+                    yield "back", u, v
+                elif d_time[u] < d_time[v]:
+                    yield "forward", u, v
+                else:
+                    yield "cross", u, v
+            else:
+                stack.pop()
+                done.add(u)
+                time += 1
+                yield "finish", u, time
 
 
 class DisjointSet:
@@ -115,6 +292,273 @@ def kruskal(nodes, weighted_edges):
     return mst, total
 
 
+# ---------- Out-of-core Kruskal ---------- #
+# Edge files are flat little-endian (weight: f64, u: i64, v: i64) records.
+EDGE_RECORD = struct.Struct("<dqq")
+
+
+def write_edge_file(path, edges):
+    """Write (weight, u, v) tuples with integer vertex ids to path."""
+    with open(path, "wb") as f:
+        for w, u, v in edges:
+            f.write(EDGE_RECORD.pack(w, u, v))
+
+
+def read_edge_file(path, buffer_records=65536):
+    """Stream (weight, u, v) tuples back from an edge file."""
+    size = EDGE_RECORD.size
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(size * buffer_records)
+            if not chunk:
+                return
+            yield from EDGE_RECORD.iter_unpack(chunk)
+
+
+def external_sort_edges(in_path, out_path, run_records=1_000_000, tmpdir=None, fan_in=64):
+    """
+    Sort an edge file by weight holding at most run_records edges in memory:
+    sorted runs are spilled to temp files, then merged at most fan_in at a
+    time (in several passes if needed). Each open run reads through a
+    run_records // fan_in buffer, so memory and open files stay bounded.
+    A failed sort leaves no out_path behind.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    buffer_records = max(1, run_records // fan_in)
+    runs, temps = [], []
+    try:
+        run = []
+        for edge in read_edge_file(in_path, buffer_records):
+            run.append(edge)
+            if len(run) == run_records:
+                run.sort()
+                runs.append(_temp_edge_file(run, tmpdir, temps))
+                run = []
+        if run or not runs:
+            run.sort()
+            runs.append(_temp_edge_file(run, tmpdir, temps))
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                merged.append(_temp_edge_file(_merge_runs(group, buffer_records), tmpdir, temps))
+                for r in group:
+                    os.remove(r)
+            runs = merged
+        write_edge_file(out_path, _merge_runs(runs, buffer_records))
+    except BaseException:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
+    finally:
+        for r in temps:
+            if os.path.exists(r):
+                os.remove(r)
+
+
+def _merge_runs(runs, buffer_records):
+    return heapq.merge(*(read_edge_file(r, buffer_records) for r in runs))
+
+
+def _temp_edge_file(edges, tmpdir, temps):
+    fd, path = tempfile.mkstemp(suffix=".edges", dir=tmpdir)
+    os.close(fd)
+    temps.append(path)
+    write_edge_file(path, edges)
+    return path
+
+
+class ArrayDisjointSet:
+    """Union-Find over ids 0..n-1 backed by flat arrays."""
+
+    def __init__(self, n):
+        self.parent = array("q", range(n))
+        self.rank = array("b", bytes(n))
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        xroot, yroot = self.find(x), self.find(y)
+        if xroot == yroot:
+            return False
+        # union by rank
+        if self.rank[xroot] < self.rank[yroot]:
+            self.parent[xroot] = yroot
+        elif self.rank[xroot] > self.rank[yroot]:
+            self.parent[yroot] = xroot
+        else:
+            self.parent[yroot] = xroot
+            self.rank[xroot] += 1
+        return True
+
+
+def kruskal_stream(n, sorted_edges):
+    """
+    Kruskal over an already weight-sorted stream of (weight, u, v) edges
+    on vertex ids 0..n-1. Yields MST edges (u, v, w) as they are accepted
+    and stops reading once n-1 have been found.
+    """
+    ds = ArrayDisjointSet(n)
+    remaining = n - 1
+    for w, u, v in sorted_edges:
+        if remaining <= 0:
+            return
+        if ds.union(u, v):
+            yield u, v, w
+            remaining -= 1
+
+
+def kruskal_external(n, edge_path, mst_path, run_records=1_000_000, tmpdir=None):
+    """
+    Out-of-core Kruskal: externally sort edge_path, then stream it through
+    kruskal_stream, appending MST edges to mst_path as they are found.
+    returns: number of MST edges, total_weight
+    """
+    fd, sorted_path = tempfile.mkstemp(suffix=".edges", dir=tmpdir)
+    os.close(fd)
+    try:
+        external_sort_edges(edge_path, sorted_path, run_records, tmpdir)
+        count, total = 0, 0
+        with open(mst_path, "wb") as out:
+            for u, v, w in kruskal_stream(n, read_edge_file(sorted_path)):
+                out.write(EDGE_RECORD.pack(w, u, v))
+                count += 1
+                total += w
+        return count, total
+    finally:
+        if os.path.exists(sorted_path):     # a failed sort already removed it
+            os.remove(sorted_path)
+
+
+# ---------- Parallel Borůvka ---------- #
+def boruvka(nodes, weighted_edges, workers=None, chunks_per_worker=4):
+    """
+    Borůvka’s minimum‑spanning‑tree algorithm. Every round each component
+    picks its cheapest outgoing edge. That scan is split into vertex
+    ranges (balanced by incident edges) run on a process pool (workers=1
+    keeps it in-process). Each task reduces its range to one candidate per
+    component it touches, so every vertex feeds at most one entry back and
+    the parent merges at most n entries per round whatever the worker
+    count. The edge and incidence arrays reach each worker once, through
+    the pool initializer, and the per-round component labels go through
+    one shared-memory array, so a task only carries its (lo, hi) bounds.
+
+    nodes: iterable of vertex names
+    weighted_edges: iterable of (weight, u, v) tuples
+    returns: mst_edges (u,v,w) list, total_weight
+    """
+    names = list(nodes)
+    ids = {x: i for i, x in enumerate(names)}
+    ws, us, vs = [], array("q"), array("q")
+    for w, u, v in weighted_edges:
+        ws.append(w)
+        us.append(ids[u])
+        vs.append(ids[v])
+    n = len(names)
+
+    # incidence lists: edges touching vertex x are inc[off[x]:off[x + 1]]
+    off = array("q", bytes(8 * (n + 1)))
+    for u, v in zip(us, vs):
+        if u != v:                      # a self-loop never leaves its component
+            off[u + 1] += 1
+            off[v + 1] += 1
+    for x in range(n):
+        off[x + 1] += off[x]
+    inc, fill = array("q", bytes(8 * off[n])), off[:n]
+    for e, (u, v) in enumerate(zip(us, vs)):
+        if u != v:
+            inc[fill[u]] = e
+            fill[u] += 1
+            inc[fill[v]] = e
+            fill[v] += 1
+    edges = (ws, us, vs, off, inc)
+
+    shm = comp = None
+    if workers == 1:
+        comp = array("q", bytes(8 * n))
+        _boruvka_init(edges, comp)
+        pool, nchunks = None, 1
+    else:
+        workers = workers or os.cpu_count() or 1
+        shm = shared_memory.SharedMemory(create=True, size=8 * max(n, 1))
+        comp = shm.buf.cast("q")
+        pool = ProcessPoolExecutor(workers, initializer=_boruvka_init,
+                                   initargs=(edges, shm.name))
+        nchunks = chunks_per_worker * workers
+    cuts = sorted({0, n} | {bisect_left(off, off[n] * i // nchunks, 0, n)
+                            for i in range(1, nchunks)})
+    bounds = list(zip(cuts, cuts[1:]))
+
+    ds = ArrayDisjointSet(n)
+    mst, total = [], 0
+    try:
+        while len(mst) < n - 1:
+            comp[:n] = array("q", (ds.find(i) for i in range(n)))
+            parts = map(_boruvka_scan, bounds) if pool is None \
+                else pool.map(_boruvka_scan, bounds)
+            best = {}
+            for part in parts:
+                for c, e in part.items():
+                    if c not in best or (ws[e], e) < (ws[best[c]], best[c]):
+                        best[c] = e
+            if not best:
+                break  # graph is disconnected: this is a spanning forest
+            for e in best.values():
+                if ds.union(us[e], vs[e]):
+                    mst.append((names[us[e]], names[vs[e]], ws[e]))
+                    total += ws[e]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if shm is not None:
+            comp.release()
+            shm.close()
+            shm.unlink()
+    return mst, total
+
+
+# per-process edge/incidence arrays and component labels, set once by the pool initializer
+_boruvka_edges = None
+_boruvka_comp = None
+_boruvka_shm = None     # keeps a worker's shared-memory mapping alive
+
+
+def _boruvka_init(edges, comp):
+    """comp is the label array itself in-process, or a shared-memory name."""
+    global _boruvka_edges, _boruvka_comp, _boruvka_shm
+    _boruvka_edges = edges
+    if isinstance(comp, str):
+        _boruvka_shm = shared_memory.SharedMemory(name=comp)
+        comp = _boruvka_shm.buf.cast("q")
+    _boruvka_comp = comp
+
+
+def _boruvka_scan(bounds):
+    """Cheapest edge index leaving each component, over the edges incident
+    to vertices [lo, hi); ties go to the lower index, as in the merge."""
+    lo, hi = bounds
+    ws, us, vs, off, inc = _boruvka_edges
+    comp = _boruvka_comp
+    best = {}
+    for x in range(lo, hi):
+        cx = comp[x]
+        b = best.get(cx)
+        for e in inc[off[x]:off[x + 1]]:
+            if comp[us[e] ^ vs[e] ^ x] == cx:      # the other endpoint
+                continue
+            if b is None or ws[e] < ws[b] or (ws[e] == ws[b] and e < b):
+                b = e
+        if b is not None:
+            best[cx] = b
+    return best
+
+
 # ---------- Example Graphs from CLRS (3rd ed.) ---------- #
 # 1. Topological Sort (Figure 22‑4 “Laundry” DAG)
 ts_edges = [
@@ -159,16 +603,60 @@ weighted_edges_kruskal = [
 ]
 
 # ---------- Run Tests ---------- #
-print("Topological sort order:")
-print(topological_sort(ts_edges))
-
-print("\nDFS discovery & finishing times:")
-d_times, f_times, parents, finished = depth_first_search(dfs_graph)
-for v in sorted(dfs_graph.keys()):
-    print(f"{v}: d={d_times[v]}, f={f_times[v]}, parent={parents[v]}")
-print("Finish stack (topological by finish time):", finished)
-
-print("\nKruskal MST edges and total weight:")
-mst_edges, mst_weight = kruskal(nodes_kruskal, weighted_edges_kruskal)
-print("Edges in MST:", mst_edges)
-print("Total weight:", mst_weight)
\ No newline at end of file
+if __name__ == "__main__":
+    print("Topological sort order:")
+    print(topological_sort(ts_edges))
+    print("Levels (nodes in a level can run in parallel):")
+    print(topological_levels(ts_edges, nodes=["watch"]))
+
+    sched = TopologicalScheduler(ts_edges, nodes=["watch"])
+    batches = []
+    while sched.is_active():
+        batch = sched.get_ready()
+        batches.append(batch)
+        for job in batch:
+            sched.mark_done(job)
+    print("Scheduler batches:", batches)
+
+    dag = IncrementalDAG(nodes=["watch"])
+    for u, v in reversed(ts_edges):
+        dag.add_edge(u, v)
+    print("Incremental order:", dag.order())
+
+    print("\nDFS discovery & finishing times:")
+    d_times, f_times, parents, finished = depth_first_search(dfs_graph)
+    for v in sorted(dfs_graph.keys()):
+        print(f"{v}: d={d_times[v]}, f={f_times[v]}, parent={parents[v]}")
+    print("Finish stack (topological by finish time):", finished)
+    print("Edge types:", [(u, v, kind) for kind, u, v in dfs_events(dfs_graph)
+                          if kind in ("tree", "back", "forward", "cross")])
+
+    # a 100k-vertex path would overflow a recursive visit()
+    long_path = {i: [i + 1] for i in range(100_000)}
+    print("Deep DFS finish of vertex 0:", depth_first_search(long_path)[1][0])
+
+    print("\nKruskal MST edges and total weight:")
+    mst_edges, mst_weight = kruskal(nodes_kruskal, weighted_edges_kruskal)
+    print("Edges in MST:", mst_edges)
+    print("Total weight:", mst_weight)
+
+    print("\nOut-of-core Kruskal on the same graph:")
+    ids = {name: i for i, name in enumerate(nodes_kruskal)}
+    with tempfile.TemporaryDirectory() as tmp:
+        edge_file = os.path.join(tmp, "edges.bin")
+        mst_file = os.path.join(tmp, "mst.bin")
+        write_edge_file(edge_file, [(w, ids[u], ids[v]) for w, u, v in weighted_edges_kruskal])
+        count, total = kruskal_external(len(ids), edge_file, mst_file, run_records=4, tmpdir=tmp)
+        print("Edges in MST:", [(nodes_kruskal[u], nodes_kruskal[v], w)
+                                for w, u, v in read_edge_file(mst_file)])
+        print("Total weight:", total)
+        # one-edge runs merged two at a time, over several passes
+        sorted_file = os.path.join(tmp, "sorted.bin")
+        external_sort_edges(edge_file, sorted_file, run_records=1, tmpdir=tmp, fan_in=2)
+        print("Multi-pass external sort is ordered:",
+              list(read_edge_file(sorted_file)) == sorted(read_edge_file(edge_file)))
+
+    print("\nParallel Borůvka MST on the same graph:")
+    mst_edges, mst_weight = boruvka(nodes_kruskal, weighted_edges_kruskal, workers=2)
+    print("Edges in MST:", mst_edges)
+    print("Total weight:", mst_weight)
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Benchmark suite for the HandsOn14 / HandsOn15 graph algorithms.
+
+Generates seeded synthetic graphs (grid, random sparse, scale-free, dense,
+DAG, negative weights without negative cycles), times each algorithm over a
+size sweep, records peak memory with tracemalloc and writes JSON results.
+
+    python graph_bench.py --sizes 100 1000 10000 --out results.json
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "HandsOn14"))
+
+from shortest_paths import Graph, dijkstra, bellman_ford, floyd_warshall
+from handson14 import topological_sort, depth_first_search, kruskal
+
+
+# ------------- Graph generators (edges are (u, v, w) on ids 0..n-1) -------------
+def grid_graph(n, seed=0, max_w=100):
+    rng = random.Random(seed)
+    side = max(1, math.isqrt(n))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                edges.append((u, u + 1, rng.randint(1, max_w)))
+            if r + 1 < side:
+                edges.append((u, u + side, rng.randint(1, max_w)))
+    return side * side, edges
+
+
+def random_sparse_graph(n, seed=0, avg_degree=4, max_w=100):
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, max_w))
+             for _ in range(n * avg_degree)]
+    return n, edges
+
+
+def scale_free_graph(n, seed=0, m=3, max_w=100):
+    """Barabási–Albert preferential attachment. The graph is undirected, so
+    each edge is emitted both ways and vertex 0 reaches everything."""
+    rng = random.Random(seed)
+    targets = list(range(min(m, n)))
+    ends = []  # every edge endpoint, so sampling it is degree-proportional
+    edges = []
+    for u in range(len(targets), n):
+        for v in set(targets):
+            w = rng.randint(1, max_w)
+            edges += ((u, v, w), (v, u, w))
+            ends += (u, v)
+        targets = [rng.choice(ends) for _ in range(m)]
+    return n, edges
+
+
+def dense_graph(n, seed=0, p=0.5, max_w=100):
+    rng = random.Random(seed)
+    edges = [(u, v, rng.randint(1, max_w))
+             for u in range(n) for v in range(n) if u != v and rng.random() < p]
+    return n, edges
+
+
+def dag_graph(n, seed=0, avg_degree=4, max_w=100):
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(n * avg_degree):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((min(u, v), max(u, v), rng.randint(1, max_w)))
+    return n, edges
+
+
+def negative_weight_graph(n, seed=0, avg_degree=4, max_w=100):
+    """Negative edges but no negative cycle: w = base + p[u] - p[v], base >= 0."""
+    rng = random.Random(seed)
+    p = [rng.randint(0, max_w) for _ in range(n)]
+    edges = []
+    for _ in range(n * avg_degree):
+        u, v = rng.randrange(n), rng.randrange(n)
+        edges.append((u, v, rng.randint(0, max_w) + p[u] - p[v]))
+    return n, edges
+
+
+GENERATORS = {
+    "grid": grid_graph,
+    "random_sparse": random_sparse_graph,
+    "scale_free": scale_free_graph,
+    "dense": dense_graph,
+    "dag": dag_graph,
+    "negative": negative_weight_graph,
+}
+
+
+# ------------- Adapters from edge lists to each algorithm's input -------------
+def to_graph(n, edges):
+    g = Graph()
+    for u, v, w in edges:
+        g.add_edge(u, v, w)
+    return g
+
+
+def to_matrix(n, edges):
+    W = {i: {} for i in range(n)}
+    for u, v, w in edges:
+        W[u][v] = min(w, W[u].get(v, math.inf))
+    return W
+
+
+def to_adjacency(n, edges):
+    adj = {i: [] for i in range(n)}
+    for u, v, _ in edges:
+        adj[u].append(v)
+    return adj
+
+
+# Each prepare_* builds the input outside the timed region and returns a thunk.
+def prepare_dijkstra(n, edges):
+    g = to_graph(n, edges)
+    return lambda: dijkstra(g, 0)
+
+
+def prepare_dijkstra_indexed(n, edges):
+    g = to_graph(n, edges)
+    return lambda: dijkstra(g, 0, heap="indexed")
+
+
+def prepare_bellman_ford(n, edges):
+    g = to_graph(n, edges)
+    return lambda: bellman_ford(g, 0)
+
+
+def prepare_floyd_warshall(n, edges):
+    W = to_matrix(n, edges)
+    return lambda: floyd_warshall(W)
+
+
+def prepare_topological_sort(n, edges):
+    pairs = [(u, v) for u, v, _ in edges]
+    return lambda: topological_sort(pairs)
+
+
+def prepare_depth_first_search(n, edges):
+    adj = to_adjacency(n, edges)
+    return lambda: depth_first_search(adj)
+
+
+def prepare_kruskal(n, edges):
+    wes = [(w, u, v) for u, v, w in edges]
+    return lambda: kruskal(range(n), wes)
+
+
+NON_NEGATIVE = {"grid", "random_sparse", "scale_free", "dense", "dag"}
+
+# (algorithm, shapes it applies to, largest n worth timing, prepare)
+CASES = [
+    ("dijkstra", NON_NEGATIVE, None, prepare_dijkstra),
+    ("dijkstra_indexed", NON_NEGATIVE, None, prepare_dijkstra_indexed),
+    ("bellman_ford", set(GENERATORS), 5_000, prepare_bellman_ford),
+    ("floyd_warshall", set(GENERATORS), 300, prepare_floyd_warshall),
+    ("topological_sort", {"dag"}, None, prepare_topological_sort),
+    ("depth_first_search", set(GENERATORS), None, prepare_depth_first_search),
+    ("kruskal", NON_NEGATIVE - {"dag"}, None, prepare_kruskal),
+]
+
+
+# ------------- Runner -------------
+def measure(thunk, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        thunk()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    thunk()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, shapes, algorithms, repeat=3, seed=0, dense_max=2_000):
+    results = []
+    for shape in shapes:
+        for size in sizes:
+            if shape == "dense" and size > dense_max:
+                continue
+            n, edges = GENERATORS[shape](size, seed=seed)
+            for name, ok_shapes, max_n, prepare in CASES:
+                if name not in algorithms or shape not in ok_shapes:
+                    continue
+                if max_n is not None and n > max_n:
+                    continue
+                seconds, peak = measure(prepare(n, edges), repeat)
+                row = {"algorithm": name, "shape": shape, "n": n, "m": len(edges),
+                       "seconds": seconds, "peak_bytes": peak, "seed": seed}
+                results.append(row)
+                print(f"{name:20s} {shape:14s} n={n:<7d} m={len(edges):<8d} "
+                      f"{seconds * 1e3:10.2f} ms {peak / 1024:10.1f} KiB")
+    return results
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    ap.add_argument("--shapes", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    ap.add_argument("--algorithms", nargs="+", default=[c[0] for c in CASES],
+                    choices=[c[0] for c in CASES])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default="graph_bench_results.json")
+    args = ap.parse_args(argv)
+
+    results = run(args.sizes, args.shapes, set(args.algorithms), args.repeat, args.seed)
+    with open(args.out, "w") as f:
+        json.dump({"python": sys.version, "results": results}, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
 import math
 import heapq
-from collections import defaultdict, deque
+import importlib.util
+import os
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # the matrix engine below is optional
+    np = None
 
 # ------------- Core data structure -------------
 class Graph:
@@ -8,23 +17,134 @@ class Graph:
     def __init__(self, directed: bool = True):
         self.directed = directed
         self.adj = defaultdict(list)
+        self._radj, self._radj_version = None, -1
+        self._vertices = set()
+        self._frozen_vertices = frozenset()
+        self.version = 0    # bumped on every edit, see DijkstraCache
+
+    def add_vertex(self, v):
+        self._vertices.add(v)
+        self.version += 1
 
     def add_edge(self, u, v, w):
         self.adj[u].append((v, w))
         if not self.directed:
             self.adj[v].append((u, w))
+        self._vertices.add(u)
+        self._vertices.add(v)
+        self.version += 1
+
+    def update_edge(self, u, v, w, old=None):
+        """Set the weight of the existing edge u->v (v-u too if undirected).
+        With parallel edges, old picks the one currently weighing old;
+        by default the first u->v edge is updated."""
+        if old is None:
+            old = self.edge_weight(u, v)
+        pairs = [(u, v)] if self.directed else [(u, v), (v, u)]
+        for a, b in pairs:
+            for i, (x, xw) in enumerate(self.adj.get(a, ())):
+                if x == b and xw == old:
+                    self.adj[a][i] = (b, w)
+                    break
+            else:
+                raise KeyError(f"No edge {u!r} -> {v!r}")
+        self.version += 1
+
+    def edge_weight(self, u, v):
+        """Weight of the first edge u->v."""
+        for x, w in self.adj.get(u, ()):
+            if x == v:
+                return w
+        raise KeyError(f"No edge {u!r} -> {v!r}")
+
+    def reverse_adj(self):
+        """In-edges v -> [(u, w)], built on first use and rebuilt after edits."""
+        if not self.directed:
+            return self.adj
+        if self._radj_version != self.version:
+            radj = defaultdict(list)
+            for u, edges in self.adj.items():
+                for v, w in edges:
+                    radj[v].append((u, w))
+            self._radj, self._radj_version = radj, self.version
+        return self._radj
 
     @property
     def vertices(self):
-        verts = set(self.adj.keys())
-        for u in self.adj:
-            for v, _ in self.adj[u]:
-                verts.add(v)
-        return verts
+        """Read-only snapshot of the vertex set, safe to iterate while adding edges."""
+        # vertices are never removed, so a size change is the only way it goes stale
+        if len(self._frozen_vertices) != len(self._vertices):
+            self._frozen_vertices = frozenset(self._vertices)
+        return self._frozen_vertices
+
+    def to_csr(self):
+        return CSRGraph.from_graph(self)
+
+
+# ------------- Frozen CSR form -------------
+class CSRGraph:
+    """Read-only compressed-sparse-row snapshot of a Graph.
+
+    Vertices are renumbered 0..n-1; the out-edges of vertex i are
+    targets[offsets[i]:offsets[i+1]] with matching weights.
+    """
+    def __init__(self, labels, offsets, targets, weights):
+        self.labels = labels                                  # id -> label
+        self.index = {v: i for i, v in enumerate(labels)}     # label -> id
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_graph(cls, G: Graph):
+        labels = list(G.adj.keys())
+        index = {v: i for i, v in enumerate(labels)}
+        for u in G.adj:
+            for v, _ in G.adj[u]:
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+        for v in G.vertices:            # isolated vertices from add_vertex
+            if v not in index:
+                index[v] = len(labels)
+                labels.append(v)
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for u in labels:
+            for v, w in G.adj.get(u, ()):
+                targets.append(index[v])
+                weights.append(w)
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, weights)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def to_dicts(self, dist, pred):
+        """Translate id-indexed dist/pred arrays back to label-keyed dicts."""
+        labels = self.labels
+        return ({labels[i]: d for i, d in enumerate(dist)},
+                {labels[i]: (labels[p] if p >= 0 else None)
+                 for i, p in enumerate(pred)})
 
 
 # ------------- 1. Dijkstra (non-negative) -------------
-def dijkstra(G: Graph, src):
+def dijkstra(G: Graph, src, heap="lazy"):
+    """
+    heap="lazy" pushes a duplicate heapq entry per relaxation (heap grows
+    to O(E)); heap="indexed" uses an IndexedMinHeap with decrease_key, so
+    it never holds more than one entry per vertex (O(V)).
+    """
+    if heap == "indexed":
+        return _dijkstra_indexed(G, src)
+    if heap != "lazy":
+        raise ValueError(f"Unknown heap {heap!r}")
     dist = {v: math.inf for v in G.vertices}
     pred = {v: None for v in G.vertices}
     dist[src] = 0
@@ -41,6 +161,220 @@ def dijkstra(G: Graph, src):
     return dist, pred
 
 
+def _dijkstra_indexed(G: Graph, src):
+    IndexedMinHeap = _indexed_min_heap()
+    dist = {v: math.inf for v in G.vertices}
+    pred = {v: None for v in G.vertices}
+    dist[src] = 0
+    pq = IndexedMinHeap([(src, 0)])
+    while pq:
+        u, d = pq.pop()
+        for v, w in G.adj[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                pred[v] = u
+                if v in pq:
+                    pq.decrease_key(v, dist[v])
+                else:
+                    pq.insert(v, dist[v])
+    return dist, pred
+
+
+_minheap = None
+
+
+def _indexed_min_heap():
+    """IndexedMinHeap from ../HandsOn6/minheap.py, loaded by path on first use
+    so neither sys.path nor any other module called minheap is involved."""
+    global _minheap
+    if _minheap is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "HandsOn6", "minheap.py")
+        spec = importlib.util.spec_from_file_location("_handson6_minheap", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _minheap = module
+    return _minheap.IndexedMinHeap
+
+
+# ------------- 1c. Memoized Dijkstra -------------
+class DijkstraCache:
+    """
+    LRU cache of dijkstra(G, src) results. Any edit to G bumps
+    G.version, which empties the cache on the next query.
+    The cached dicts are shared between callers; treat them as read-only.
+    """
+    def __init__(self, G: Graph, maxsize: int = 128):
+        self.G = G
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._version = G.version
+        self._results = OrderedDict()
+
+    def query(self, src):
+        if self._version != self.G.version:
+            self.clear()
+            self._version = self.G.version
+        if src in self._results:
+            self.hits += 1
+            self._results.move_to_end(src)
+            return self._results[src]
+        self.misses += 1
+        result = dijkstra(self.G, src)
+        if self.maxsize > 0:
+            self._results[src] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._results.clear()
+
+    def cache_info(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "maxsize": self.maxsize, "currsize": len(self._results)}
+
+
+# ------------- 1d. Incremental repair -------------
+class DynamicSSSP:
+    """
+    Single-source distances kept current under edge insertions and
+    weight decreases (non-negative weights). Each change relaxes the
+    changed edge and then runs the dijkstra loop only over the vertices
+    whose distance actually improved.
+    """
+    def __init__(self, G: Graph, src):
+        self.G = G
+        self.src = src
+        self.dist, self.pred = dijkstra(G, src)
+
+    def add_edge(self, u, v, w):
+        self._need_non_negative(w)
+        self.G.add_edge(u, v, w)
+        self._repair(u, v, w)
+
+    def decrease_weight(self, u, v, w, old=None):
+        """Lower the u->v edge weighing old (the first u->v edge by default) to w."""
+        self._need_non_negative(w)
+        if old is None:
+            old = self.G.edge_weight(u, v)
+        if w > old:
+            raise ValueError("Weight increases need a full dijkstra rerun.")
+        self.G.update_edge(u, v, w, old)
+        self._repair(u, v, w)
+
+    @staticmethod
+    def _need_non_negative(w):
+        # a negative edge could close a negative cycle, and _repair would never settle
+        if w < 0:
+            raise ValueError("DynamicSSSP needs non-negative weights.")
+
+    def _repair(self, u, v, w):
+        dist, pred = self.dist, self.pred
+        pq = []
+        ends = [(u, v)] if self.G.directed else [(u, v), (v, u)]
+        for a, b in ends:
+            nd = dist.get(a, math.inf) + w
+            if nd < dist.get(b, math.inf):
+                dist[b] = nd
+                pred[b] = a
+                heapq.heappush(pq, (nd, b))
+        while pq:
+            d, x = heapq.heappop(pq)
+            if d != dist[x]:
+                continue
+            for y, wy in self.G.adj[x]:
+                if d + wy < dist.get(y, math.inf):
+                    dist[y] = d + wy
+                    pred[y] = x
+                    heapq.heappush(pq, (dist[y], y))
+        for x in ends[0]:
+            dist.setdefault(x, math.inf)
+            pred.setdefault(x, None)
+
+
+# ------------- 1a. Point-to-point queries (non-negative) -------------
+def shortest_path(G: Graph, s, t, method="dijkstra", heuristic=None):
+    """
+    Single s->t query that stops once t is settled and only keeps state
+    for vertices it touches.
+    method: "dijkstra", "bidirectional" or "astar" (heuristic(v) must be
+    an admissible estimate of the v->t distance)
+    returns: distance, path (math.inf, None if t is unreachable)
+    """
+    if method == "bidirectional":
+        return _bidirectional(G, s, t)
+    if method == "astar":
+        if heuristic is None:
+            raise ValueError("A* needs a heuristic")
+        h = heuristic
+    elif method == "dijkstra":
+        h = lambda v: 0
+    else:
+        raise ValueError(f"Unknown method {method!r}")
+
+    dist = {s: 0}
+    pred = {s: None}
+    pq = [(h(s), 0, s)]
+    while pq:
+        _, d, u = heapq.heappop(pq)
+        if d != dist[u]:
+            continue
+        if u == t:
+            return d, _walk_back(pred, t)
+        for v, w in G.adj.get(u, ()):
+            nd = d + w
+            if nd < dist.get(v, math.inf):
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(pq, (nd + h(v), nd, v))
+    return math.inf, None
+
+
+def _bidirectional(G: Graph, s, t):
+    if s == t:
+        return 0, [s]
+    # index 0 searches forward from s, index 1 backward from t
+    adjs = (G.adj, G.reverse_adj())
+    dist = ({s: 0}, {t: 0})
+    pred = ({s: None}, {t: None})
+    done = (set(), set())
+    pqs = ([(0, s)], [(0, t)])
+    best, meet = math.inf, None
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+        d, u = heapq.heappop(pqs[side])
+        if u in done[side]:
+            continue
+        done[side].add(u)
+        mine, other = dist[side], dist[1 - side]
+        for v, w in adjs[side].get(u, ()):
+            nd = d + w
+            if nd < mine.get(v, math.inf):
+                mine[v] = nd
+                pred[side][v] = u
+                heapq.heappush(pqs[side], (nd, v))
+            if v in other and nd + other[v] < best:
+                best, meet = nd + other[v], v
+    if meet is None:
+        return math.inf, None
+    path = _walk_back(pred[0], meet)
+    v = pred[1][meet]
+    while v is not None:
+        path.append(v)
+        v = pred[1][v]
+    return best, path
+
+
+def _walk_back(pred, v):
+    path = []
+    while v is not None:
+        path.append(v)
+        v = pred[v]
+    return path[::-1]
+
+
 # ------------- 2. Bellman-Ford (neg edges OK) -------------
 def bellman_ford(G: Graph, src):
     verts = list(G.vertices)
@@ -68,6 +402,115 @@ def bellman_ford(G: Graph, src):
     return dist, pred, False
 
 
+# ------------- 2a. Queue-based Bellman-Ford (SPFA) -------------
+def spfa(G: Graph, src):
+    """
+    Bellman-Ford driven by a FIFO worklist: only out-edges of vertices
+    whose distance changed are relaxed again.
+    returns: dist, pred, None -- or None, None, cycle when a negative
+    cycle is reachable, cycle being its vertices in edge order
+    """
+    verts = G.vertices
+    n = len(verts)
+    dist = defaultdict(lambda: math.inf)
+    pred = {src: None}
+    hops = {src: 0}      # edges on the current tentative path
+    dist[src] = 0
+    queue = deque([src])
+    queued = {src}
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        du = dist[u]
+        for v, w in G.adj[u]:
+            if du + w < dist[v]:
+                dist[v] = du + w
+                pred[v] = u
+                hops[v] = hops[u] + 1
+                if hops[v] >= n:
+                    # a shortest path can't use |V| edges, so the pred
+                    # chain from v has closed on a negative cycle
+                    cycle = _pred_cycle(pred, v)
+                    if cycle is not None:
+                        return None, None, cycle
+                if v not in queued:
+                    queued.add(v)
+                    queue.append(v)
+    return ({v: dist[v] for v in verts},
+            {v: pred.get(v) for v in verts}, None)
+
+
+def _pred_cycle(pred, v):
+    """Follow pred pointers from v; return the cycle reached, if any."""
+    seen = set()
+    while v is not None and v not in seen:
+        seen.add(v)
+        v = pred[v]
+    if v is None:
+        return None
+    cycle = [v]
+    u = pred[v]
+    while u != v:
+        cycle.append(u)
+        u = pred[u]
+    return cycle[::-1]
+
+
+# ------------- 1b/2b. Dijkstra & Bellman-Ford over CSR -------------
+def dijkstra_csr(C: CSRGraph, src):
+    n = len(C)
+    off, tgt, wt = C.offsets, C.targets, C.weights
+    dist = array('d', [math.inf]) * n
+    pred = array('q', [-1]) * n
+    s = C.index[src]
+    dist[s] = 0
+    pq = [(0, s)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d != dist[u]:
+            continue
+        for e in range(off[u], off[u + 1]):
+            v = tgt[e]
+            nd = d + wt[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(pq, (nd, v))
+    return C.to_dicts(dist, pred)
+
+
+def bellman_ford_csr(C: CSRGraph, src):
+    n = len(C)
+    off, tgt, wt = C.offsets, C.targets, C.weights
+    dist = array('d', [math.inf]) * n
+    pred = array('q', [-1]) * n
+    dist[C.index[src]] = 0
+
+    # |V|-1 relaxation passes
+    for _ in range(n - 1):
+        updated = False
+        for u in range(n):
+            du = dist[u]
+            if du == math.inf:
+                continue
+            for e in range(off[u], off[u + 1]):
+                v = tgt[e]
+                if du + wt[e] < dist[v]:
+                    dist[v] = du + wt[e]
+                    pred[v] = u
+                    updated = True
+        if not updated:
+            break
+
+    # detect negative cycle
+    for u in range(n):
+        for e in range(off[u], off[u + 1]):
+            if dist[u] + wt[e] < dist[tgt[e]]:
+                return None, None, True
+    dist, pred = C.to_dicts(dist, pred)
+    return dist, pred, False
+
+
 # ------------- 3. Floyd-Warshall (all-pairs) -------------
 def floyd_warshall(weights: dict):
     vs = list(weights.keys())
@@ -85,6 +528,167 @@ def floyd_warshall(weights: dict):
     return dist
 
 
+# ------------- 3b. Floyd-Warshall on a NumPy matrix -------------
+def floyd_warshall_np(weights, block_size=None, with_pred=True):
+    """
+    Matrix Floyd-Warshall. weights is either the dict-of-dicts taken by
+    floyd_warshall or an n x n array (np.inf for missing edges).
+    Each k-step is one broadcast over the tile being updated. With
+    block_size set this is the three-phase tiled algorithm: for each
+    block of block_size pivots, the diagonal tile is relaxed first, then
+    the tiles in its row and column, then every remaining tile. Every
+    step touches block_size x block_size tiles only, so the working set
+    stays cache-sized however large n grows.
+    returns: vertices, dist matrix, pred matrix (pred[i, j] is the vertex
+    index before j on the shortest i->j path, -1 if none; None when
+    with_pred is False, which turns each step into a plain np.minimum)
+    """
+    if np is None:
+        raise ImportError("floyd_warshall_np requires numpy")
+    if isinstance(weights, dict):
+        vs = list(weights.keys())
+        idx = {v: i for i, v in enumerate(vs)}
+        dist = np.full((len(vs), len(vs)), np.inf)
+        for u, row in weights.items():
+            for v, w in row.items():
+                if v in idx:
+                    dist[idx[u], idx[v]] = w
+    else:
+        dist = np.array(weights, dtype=float)
+        vs = list(range(dist.shape[0]))
+    n = len(vs)
+    np.fill_diagonal(dist, 0)
+    pred = None
+    if with_pred:
+        pred = np.where(np.isfinite(dist), np.arange(n)[:, None], -1)
+        np.fill_diagonal(pred, -1)
+
+    b = block_size if block_size and block_size < n else n
+    # Tiling applies later pivots to some tiles before earlier ones. Distances
+    # come out the same, but around a zero-weight cycle the tie-breaks can
+    # leave preds pointing round the cycle, so keep the inputs for a rerun.
+    start = (dist.copy(), pred.copy()) if pred is not None and b < n else None
+    cand_buf = np.empty((b, b))
+    better_buf = np.empty((b, b), dtype=bool)
+
+    def relax(I, J, ks):
+        """Relax tile dist[I, J] through the pivots ks, one k at a time."""
+        D = dist[I, J]
+        P = pred[I, J] if pred is not None else None
+        cand = cand_buf[:D.shape[0], :D.shape[1]]
+        better = better_buf[:D.shape[0], :D.shape[1]]
+        for k in ks:
+            np.add(dist[I, k, None], dist[k, J], out=cand)
+            if P is None:
+                np.minimum(D, cand, out=D)
+                continue
+            np.less(cand, D, out=better)
+            np.copyto(D, cand, where=better)
+            np.copyto(P, pred[k, J].copy(), where=better)
+
+    blocks = [slice(lo, min(lo + b, n)) for lo in range(0, n, b)]
+    for K in blocks:
+        ks = range(K.start, K.stop)
+        relax(K, K, ks)                       # 1. the pivot tile itself
+        for other in blocks:                  # 2. its row and column of tiles
+            if other is not K:
+                relax(K, other, ks)
+                relax(other, K, ks)
+        for I in blocks:                      # 3. everything else
+            for J in blocks:
+                if I is not K and J is not K:
+                    relax(I, J, ks)
+
+    if start is not None:
+        round_trip = dist + dist.T
+        np.fill_diagonal(round_trip, np.inf)
+        if (round_trip == 0).any():           # zero-weight cycle: redo in pivot order
+            dist[:], pred[:] = start
+            cand_buf, better_buf = np.empty((n, n)), np.empty((n, n), dtype=bool)
+            relax(slice(None), slice(None), range(n))
+    return vs, dist, pred
+
+
+def fw_path(vs, pred, u, v):
+    """Rebuild the u->v vertex path from floyd_warshall_np output."""
+    i, j = vs.index(u), vs.index(v)
+    if i != j and pred[i, j] < 0:
+        return None
+    path = [v]
+    while j != i:
+        j = pred[i, j]
+        path.append(vs[j])
+    return path[::-1]
+
+
+# ------------- 4. Johnson (sparse all-pairs) -------------
+def johnson(G: Graph, workers=None):
+    """
+    All-pairs shortest paths for sparse graphs with negative edges.
+    returns: {src: dist dict}
+    """
+    return {src: dist for src, dist, _ in johnson_iter(G, workers)}
+
+
+def johnson_iter(G: Graph, workers=None, chunksize=None):
+    """
+    Reweight once with Bellman-Ford, then run Dijkstra from every vertex.
+    With workers != 1 the sources are sharded over a process pool; the
+    reweighted graph is handed to each worker once by the pool
+    initializer rather than pickled per task.
+    yields: (src, dist, pred) per source as results come back
+    """
+    hw, h, verts = _johnson_reweight(G)
+    if workers == 1:
+        _johnson_init(hw, h)
+        for src in verts:
+            yield _johnson_source(src)
+        return
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(verts) // (4 * workers))
+    with ProcessPoolExecutor(workers, initializer=_johnson_init, initargs=(hw, h)) as pool:
+        yield from pool.map(_johnson_source, verts, chunksize=chunksize)
+
+
+def _johnson_reweight(G: Graph):
+    verts = list(G.vertices)
+    q = object()  # extra source, can't clash with a real label
+    aug = Graph()
+    for u in G.adj:
+        for v, w in G.adj[u]:
+            aug.add_edge(u, v, w)
+    for v in verts:
+        aug.add_edge(q, v, 0)
+    h, _, neg_cycle = bellman_ford(aug, q)
+    if neg_cycle:
+        raise ValueError("Graph contains a negative-weight cycle.")
+
+    hw = Graph()
+    for u in G.adj:
+        for v, w in G.adj[u]:
+            hw.add_edge(u, v, w + h[u] - h[v])
+    for v in verts:
+        hw.add_vertex(v)  # keep isolated vertices
+    return hw, {v: h[v] for v in verts}, verts
+
+
+# per-process state, set once by the pool initializer
+_johnson_graph = None
+_johnson_h = None
+
+
+def _johnson_init(hw, h):
+    global _johnson_graph, _johnson_h
+    _johnson_graph, _johnson_h = hw, h
+
+
+def _johnson_source(src):
+    h = _johnson_h
+    dist, pred = dijkstra(_johnson_graph, src)
+    return src, {v: d - h[src] + h[v] for v, d in dist.items()}, pred
+
+
 # ------------------- Test helpers -------------------
 def assert_equal(a, b, msg=""):
     assert a == b, f"Assertion failed: {msg} Expected {b}, got {a}"
@@ -129,8 +733,55 @@ def run_tests():
     dist_dij, _ = dijkstra(g_dij, 's')
     expected_dij = {'s':0, 't':8, 'x':9, 'y':5, 'z':7}
     assert_dist_dict(dist_dij, expected_dij)
+    assert_equal(dijkstra(g_dij, 's', heap="indexed"), dijkstra(g_dij, 's'), "indexed heap")
     print("Dijkstra test: PASS")
 
+    # Point-to-point queries
+    for method in ("dijkstra", "bidirectional"):
+        assert_equal(shortest_path(g_dij, 's', 'x', method), (9, ['s', 'y', 't', 'x']),
+                     f"{method} s->x")
+        assert_equal(shortest_path(g_dij, 'x', 'x', method), (0, ['x']), f"{method} x->x")
+    assert_equal(shortest_path(g_dij, 's', 'x', "astar", heuristic=lambda v: 0),
+                 (9, ['s', 'y', 't', 'x']), "A* s->x")
+    assert_equal(shortest_path(g_dij, 's', 'nowhere', "bidirectional"), (math.inf, None),
+                 "unreachable target")
+    print("Point-to-point test: PASS")
+
+    # Cached vertex set and memoized Dijkstra
+    g_cache = build_clrs_dijkstra_graph()
+    assert_equal(g_cache.vertices, set('stxyz'), "vertex set")
+    for v in g_cache.vertices:                        # Johnson-style augmentation
+        g_cache.add_edge('q', v, 0)
+    assert_equal(g_cache.vertices, set('stxyzq'), "vertex set after augmentation")
+    g_cache = build_clrs_dijkstra_graph()
+    cache = DijkstraCache(g_cache, maxsize=1)
+    assert cache.query('s') is cache.query('s'), "cache hit"
+    cache.query('t')                                  # evicts 's'
+    g_cache.add_edge('s', 'x', 1)                     # drops 't'
+    assert_dist_dict(cache.query('s')[0], {'x': 1})
+    assert_equal(cache.cache_info(), {"hits": 1, "misses": 3, "maxsize": 1, "currsize": 1},
+                 "cache stats")
+    print("Dijkstra cache test: PASS")
+
+    # Incremental repair agrees with a rerun
+    g_dyn = build_clrs_dijkstra_graph()
+    dyn = DynamicSSSP(g_dyn, 's')
+    dyn.add_edge('s', 'x', 6)
+    dyn.decrease_weight('y', 't', 1)
+    dyn.add_edge('z', 'new', 1)
+    assert_equal(dyn.dist, dijkstra(g_dyn, 's')[0], "incremental dist")
+    assert_dist_dict(dyn.dist, {'t': 6, 'x': 6, 'new': 8})
+    dyn.add_edge('s', 'x', 10)                        # parallel to the weight-6 edge
+    dyn.decrease_weight('s', 'x', 7, old=10)
+    assert_equal(sorted(w for v, w in g_dyn.adj['s'] if v == 'x'), [6, 7], "parallel edge update")
+    assert_equal(dyn.dist, dijkstra(g_dyn, 's')[0], "incremental dist (parallel edges)")
+    try:
+        dyn.decrease_weight('x', 'z', -5)
+        raise AssertionError("negative weight accepted")
+    except ValueError:
+        pass
+    print("Incremental SSSP test: PASS")
+
     # Bellman-Ford
     g_bf = build_clrs_bf_graph()
     dist_bf, _, neg_cycle = bellman_ford(g_bf, 's')
@@ -139,6 +790,36 @@ def run_tests():
     assert_dist_dict(dist_bf, expected_bf)
     print("Bellman-Ford test: PASS")
 
+    # CSR variants must agree with the dict versions
+    csr_dij = g_dij.to_csr()
+    assert_equal(csr_dij.num_edges, 10, "CSR edge count")
+    dist_c, pred_c = dijkstra_csr(csr_dij, 's')
+    assert_dist_dict(dist_c, expected_dij)
+    assert_equal(pred_c, dijkstra(g_dij, 's')[1], "CSR Dijkstra preds")
+    dist_c, _, neg_cycle = bellman_ford_csr(g_bf.to_csr(), 's')
+    assert not neg_cycle, "Unexpected negative cycle (CSR)"
+    assert_dist_dict(dist_c, expected_bf)
+    neg = Graph()
+    for u, v, w in [('a', 'b', 1), ('b', 'c', -2), ('c', 'a', -1)]:
+        neg.add_edge(u, v, w)
+    assert_equal(bellman_ford_csr(neg.to_csr(), 'a'), (None, None, True), "CSR neg cycle")
+    iso = Graph()
+    iso.add_edge('a', 'b', 1)
+    iso.add_vertex('iso')
+    assert_equal(len(iso.to_csr()), 3, "CSR keeps isolated vertices")
+    assert_equal(dijkstra_csr(iso.to_csr(), 'iso')[0], {'a': math.inf, 'b': math.inf, 'iso': 0},
+                 "CSR Dijkstra from an isolated vertex")
+    print("CSR Dijkstra/Bellman-Ford test: PASS")
+
+    # SPFA
+    dist_q, pred_q, cycle = spfa(g_bf, 's')
+    assert cycle is None, "Unexpected negative cycle (SPFA)"
+    assert_dist_dict(dist_q, expected_bf)
+    assert_equal(pred_q, bellman_ford(g_bf, 's')[1], "SPFA preds")
+    _, _, cycle = spfa(neg, 'a')
+    assert_equal(sorted(cycle), ['a', 'b', 'c'], "SPFA negative cycle")
+    print("SPFA test: PASS")
+
     # Floyd-Warshall
     W = build_clrs_fw_matrix()
     dist_fw = floyd_warshall(W)
@@ -154,4 +835,35 @@ def run_tests():
                 f"FW dist({i},{j}) incorrect"
     print("Floyd-Warshall test: PASS")
 
-run_tests()
+    # Johnson, in-process and on a pool
+    for workers in (1, 2):
+        apsp = johnson(g_bf, workers=workers)
+        assert_dist_dict(apsp['s'], expected_bf)
+        for u in apsp:
+            assert_equal(apsp[u], bellman_ford(g_bf, u)[0], f"Johnson row {u}")
+    try:
+        johnson(neg, workers=1)
+        raise AssertionError("Johnson missed a negative cycle")
+    except ValueError:
+        pass
+    print("Johnson test: PASS")
+
+    # Matrix Floyd-Warshall, plain and blocked
+    if np is not None:
+        for bs in (None, 3):
+            vs, D, P = floyd_warshall_np(W, block_size=bs)
+            for i in expected_fw:
+                for j in expected_fw[i]:
+                    assert_equal(D[vs.index(i), vs.index(j)], expected_fw[i][j],
+                                 f"FW-np dist({i},{j})")
+            assert_equal(fw_path(vs, P, 1, 4), [1, 2, 3, 4], "FW-np path")
+            assert_equal(fw_path(vs, P, 4, 3), [4, 1, 2, 3], "FW-np path")
+        _, D2, P2 = floyd_warshall_np(W, block_size=2, with_pred=False)
+        assert P2 is None and (D2 == D).all(), "FW-np without preds"
+        zero = {0: {3: 1}, 1: {2: 0}, 2: {1: 0}, 3: {0: 1, 1: 1}}   # 1 <-> 2 weighs 0
+        vs, D, P = floyd_warshall_np(zero, block_size=2)
+        assert_equal(fw_path(vs, P, 0, 2), [0, 3, 1, 2], "FW-np path round a zero cycle")
+        print("Floyd-Warshall (NumPy) test: PASS")
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,132 @@
+"""
+Benchmark for the HandsOn6 priority queues against heapq.
+
+Each run prefills n random values, then does n operations mixing pushes
+and pops at a given push:pop ratio (pops on an empty heap become pushes).
+The "decrease" workload times decrease-key on IndexedMinHeap and
+PairingHeap.
+
+    python heap_bench.py --sizes 10000 100000 --ratios 1:1 3:1 1:3 --out results.json
+"""
+import argparse
+import heapq
+import json
+import random
+import sys
+import time
+from functools import partial
+
+from minheap import MinHeap, IndexedMinHeap, DaryHeap, PairingHeap
+
+
+# ------------- Queues under test: each factory returns (push, pop, size) -------------
+def make_heapq(values):
+    h = list(values)
+    heapq.heapify(h)
+    return partial(heapq.heappush, h), partial(heapq.heappop, h), h.__len__
+
+
+def make_queue(cls, *args):
+    def factory(values):
+        q = cls(*args, list(values)) if args else cls(list(values))
+        return q.insert, q.pop, q.__len__
+    return factory
+
+
+QUEUES = {
+    "heapq": make_heapq,
+    "MinHeap": make_queue(MinHeap),
+    "Dary2": make_queue(DaryHeap, 2),
+    "Dary4": make_queue(DaryHeap, 4),
+    "Dary8": make_queue(DaryHeap, 8),
+    "Pairing": make_queue(PairingHeap),
+}
+
+
+# ------------- Workloads -------------
+def mixed_ops(n, ratio, rng):
+    """n pushes/pops (None = pop) at push:pop ratio, as a list of values."""
+    pushes, pops = ratio
+    p_push = pushes / (pushes + pops)
+    return [rng.random() if rng.random() < p_push else None for _ in range(n)]
+
+
+def run_mixed(factory, start, ops):
+    push, pop, size = factory(start)
+    t0 = time.perf_counter()
+    for v in ops:
+        if v is not None:
+            push(v)
+        elif size():
+            pop()
+        else:
+            push(0.5)
+    return time.perf_counter() - t0
+
+
+def run_decrease(name, start, rng):
+    """Insert start, lower every key once in random order, then drain."""
+    order = list(range(len(start)))
+    rng.shuffle(order)
+    t0 = time.perf_counter()
+    if name == "Indexed":
+        q = IndexedMinHeap(enumerate(start))
+        for i in order:
+            q.decrease_key(i, start[i] / 2)
+    else:
+        q = PairingHeap()
+        nodes = [q.insert(v) for v in start]
+        for i in order:
+            q.decrease_key(nodes[i], start[i] / 2)
+    while len(q):
+        q.pop()
+    return time.perf_counter() - t0
+
+
+# ------------- Runner -------------
+def parse_ratio(text):
+    pushes, pops = text.split(":")
+    return int(pushes), int(pops)
+
+
+def run(sizes, ratios, queues, repeat=3, seed=0):
+    results = []
+    for n in sizes:
+        rng = random.Random(seed)
+        start = [rng.random() for _ in range(n)]
+        for ratio in ratios:
+            ops = mixed_ops(n, parse_ratio(ratio), rng)
+            base = None
+            for name in queues:
+                seconds = min(run_mixed(QUEUES[name], start, ops) for _ in range(repeat))
+                base = base or seconds
+                results.append({"queue": name, "workload": ratio, "n": n,
+                                "seconds": seconds, "seed": seed})
+                print(f"{name:8s} {ratio:>8s} n={n:<8d} {seconds * 1e3:10.2f} ms "
+                      f"{seconds / base:6.2f}x")
+        for name in ("Indexed", "Pairing"):
+            seconds = min(run_decrease(name, start, random.Random(seed)) for _ in range(repeat))
+            results.append({"queue": name, "workload": "decrease", "n": n,
+                            "seconds": seconds, "seed": seed})
+            print(f"{name:8s} {'decrease':>8s} n={n:<8d} {seconds * 1e3:10.2f} ms")
+    return results
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    ap.add_argument("--ratios", nargs="+", default=["1:1", "3:1", "1:3"])
+    ap.add_argument("--queues", nargs="+", default=list(QUEUES), choices=list(QUEUES))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out")
+    args = ap.parse_args(argv)
+
+    results = run(args.sizes, args.ratios, args.queues, args.repeat, args.seed)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"python": sys.version, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
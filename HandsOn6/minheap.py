@@ -1,7 +1,26 @@
+import heapq
+from itertools import count
+
+
 class MinHeap:
-    def __init__(self, data=None):
+    """
+    Binary min-heap in a flat list (self.heap).
+
+    insert/pop/pushpop/replace and the O(n) builds run on the heapq
+    primitives over self.heap; heapify(i) is the same hole-based sift
+    written out in Python. With key=, entries are stored decorated as
+    (key(value), seq, value), so values themselves are never compared and
+    equal keys pop in insertion order.
+    """
+
+    def __init__(self, data=None, key=None):
         """Initialize the heap with list of elements"""
-        self.heap = data if data else []
+        self.key = key
+        self._seq = count()
+        if key is None:
+            self.heap = data if data else []
+        else:
+            self.heap = [(key(v), next(self._seq), v) for v in data] if data else []
         if self.heap:
             self.build_min_heap()
 
@@ -23,79 +42,476 @@ class MinHeap:
 
     def heapify(self, i):
         """Ensures the min-heap property is maintained from index i downwards"""
-        left = self.left(i)
-        right = self.right(i)
-        smallest = i
+        # Carry the element down as a hole: one write per level, no swaps
+        heap = self.heap
+        n = len(heap)
+        item = heap[i]
+        child = (i << 1) + 1
+        while child < n:
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < item:
+                break
+            heap[i] = heap[child]
+            i = child
+            child = (i << 1) + 1
+        heap[i] = item
 
-        if left < len(self.heap) and self.heap[left] < self.heap[smallest]:
-            smallest = left
-        if right < len(self.heap) and self.heap[right] < self.heap[smallest]:
-            smallest = right
+    def build_min_heap(self):
+        """Builds a min-heap from an unordered list in O(n)"""
+        heapq.heapify(self.heap)
 
-        if smallest != i:
-            self.swap(i, smallest)
-            self.heapify(smallest)
+    def _wrap(self, value):
+        return value if self.key is None else (self.key(value), next(self._seq), value)
 
-    def build_min_heap(self):
-        """Builds a min-heap from an unordered list"""
-        for i in range(len(self.heap) // 2, -1, -1):
-            self.heapify(i)
+    def _unwrap(self, entry):
+        return entry if self.key is None else entry[2]
 
     def insert(self, value):
         """Inserts a new value into the heap"""
-        self.heap.append(value)
-        i = len(self.heap) - 1
-
-        # Bubble up the inserted element if necessary
-        while i > 0 and self.heap[self.parent(i)] > self.heap[i]:
-            self.swap(i, self.parent(i))
-            i = self.parent(i)
+        if self.key is not None:
+            value = (self.key(value), next(self._seq), value)
+        heapq.heappush(self.heap, value)
 
     def pop(self):
         """Removes and returns the minimum element (root) from the heap"""
-        if len(self.heap) == 0:
+        if not self.heap:
             raise IndexError("Heap is empty")
+        entry = heapq.heappop(self.heap)
+        return entry if self.key is None else entry[2]
 
-        root = self.heap[0]
-        last_element = self.heap.pop()
+    def peek(self):
+        """Returns the minimum element without removing it"""
+        if not self.heap:
+            return None
+        return self._unwrap(self.heap[0])
+
+    def pushpop(self, value):
+        """Inserts value, then pops and returns the minimum (one sift instead of two)"""
+        return self._unwrap(heapq.heappushpop(self.heap, self._wrap(value)))
+
+    def replace(self, value):
+        """Pops and returns the minimum, then inserts value (one sift instead of two)"""
+        if not self.heap:
+            raise IndexError("Heap is empty")
+        return self._unwrap(heapq.heapreplace(self.heap, self._wrap(value)))
+
+    def nsmallest(self, n):
+        """Returns the n smallest elements in order, leaving the heap unchanged"""
+        return [self._unwrap(e) for e in heapq.nsmallest(n, self.heap)]
+
+    def extend(self, values):
+        """Inserts many values at once"""
+        new = [self._wrap(v) for v in values]
+        heap = self.heap
+        total = len(heap) + len(new)
+        # k pushes cost ~k*log(total); one re-heapify costs ~total
+        if len(new) * total.bit_length() > total:
+            heap.extend(new)
+            heapq.heapify(heap)
+        else:
+            for entry in new:
+                heapq.heappush(heap, entry)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __repr__(self):
+        return f"MinHeap({[self._unwrap(e) for e in self.heap]})"
+
+
+class _Entry:
+    """(priority, item) pair that orders by priority only."""
+    __slots__ = ("priority", "item")
+
+    def __init__(self, priority, item):
+        self.priority = priority
+        self.item = item
 
+    def __lt__(self, other):
+        return self.priority < other.priority
+
+    def __gt__(self, other):
+        return self.priority > other.priority
+
+    def __repr__(self):
+        return f"({self.item!r}, {self.priority!r})"
+
+
+class IndexedMinHeap:
+    """Min-heap of distinct items with priorities, plus a position map
+    (item -> index) so an item can be found, re-keyed or removed in O(log n).
+    Not a MinHeap: its methods take and return (item, priority) pairs."""
+
+    def __init__(self, pairs=None):
+        """Initialize the heap with an iterable of (item, priority) pairs"""
+        self.heap = [_Entry(p, item) for item, p in pairs] if pairs else []
+        heapq.heapify(self.heap)
+        self.pos = {e.item: i for i, e in enumerate(self.heap)}
+        if len(self.pos) != len(self.heap):
+            raise ValueError("IndexedMinHeap items must be distinct")
+
+    def swap(self, i, j):
+        """Swaps two entries and keeps the position map in step"""
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.pos[heap[i].item] = i
+        self.pos[heap[j].item] = j
+
+    def heapify(self, i):
+        """Hole-based sift down that records every entry it moves in pos"""
+        heap, pos = self.heap, self.pos
+        n = len(heap)
+        entry = heap[i]
+        child = (i << 1) + 1
+        while child < n:
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            heap[i] = heap[child]
+            pos[heap[i].item] = i
+            i = child
+            child = (i << 1) + 1
+        heap[i] = entry
+        pos[entry.item] = i
+
+    def _sift_up(self, i):
+        heap, pos = self.heap, self.pos
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not entry < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i].item] = i
+            i = parent
+        heap[i] = entry
+        pos[entry.item] = i
+
+    def insert(self, item, priority):
+        """Adds item with the given priority"""
+        if item in self.pos:
+            raise KeyError(f"{item!r} is already in the heap")
+        self.heap.append(_Entry(priority, item))
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        """Removes and returns the (item, priority) pair with the smallest priority"""
+        if not self.heap:
+            raise IndexError("Heap is empty")
+        entry = self.heap[0]
+        last = self.heap.pop()
+        del self.pos[entry.item]
         if self.heap:
-            self.heap[0] = last_element
+            self.heap[0] = last
             self.heapify(0)
+        return entry.item, entry.priority
+
+    def peek(self):
+        """Returns the (item, priority) pair with the smallest priority without removing it"""
+        if not self.heap:
+            return None
+        return self.heap[0].item, self.heap[0].priority
+
+    def contains(self, item):
+        return item in self.pos
 
+    __contains__ = contains
+
+    def __len__(self):
+        return len(self.heap)
+
+    def priority(self, item):
+        return self.heap[self.pos[item]].priority
+
+    def decrease_key(self, item, priority):
+        """Lowers item's priority and bubbles it up"""
+        i = self.pos[item]
+        if priority > self.heap[i].priority:
+            raise ValueError("decrease_key cannot raise a priority")
+        self.heap[i].priority = priority
+        self._sift_up(i)
+
+    def remove(self, item):
+        """Removes item wherever it is in the heap and returns its priority"""
+        i = self.pos.pop(item)
+        entry = self.heap[i]
+        last = self.heap.pop()
+        if i < len(self.heap):
+            self.heap[i] = last
+            self.pos[last.item] = i
+            self._sift_up(i)
+            self.heapify(self.pos[last.item])
+        return entry.priority
+
+    def pushpop(self, item, priority):
+        """Inserts item, then pops and returns the smallest (item, priority) pair"""
+        if item in self.pos:
+            raise KeyError(f"{item!r} is already in the heap")
+        entry = _Entry(priority, item)
+        if not self.heap or not self.heap[0] < entry:
+            return item, priority
+        return self._replace_root(entry)
+
+    def replace(self, item, priority):
+        """Pops and returns the smallest (item, priority) pair, then inserts item"""
+        if not self.heap:
+            raise IndexError("Heap is empty")
+        if item in self.pos and self.heap[0].item != item:
+            raise KeyError(f"{item!r} is already in the heap")
+        return self._replace_root(_Entry(priority, item))
+
+    def _replace_root(self, entry):
+        root = self.heap[0]
+        del self.pos[root.item]
+        self.heap[0] = entry
+        self.heapify(0)
+        return root.item, root.priority
+
+    def nsmallest(self, n):
+        """Returns the n smallest (item, priority) pairs, leaving the heap unchanged"""
+        return [(e.item, e.priority) for e in heapq.nsmallest(n, self.heap)]
+
+    def extend(self, pairs):
+        """Inserts many (item, priority) pairs at once"""
+        for item, priority in pairs:
+            self.insert(item, priority)
+
+    def __repr__(self):
+        return f"IndexedMinHeap({self.heap})"
+
+
+class DaryHeap:
+    """
+    Min-heap with d children per node, stored in a flat list (d=2 is
+    MinHeap's layout). A wider node makes the tree shallower: sifting up
+    takes log_d(n) steps, sifting down scans d children per level.
+    """
+
+    def __init__(self, d=4, data=None):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.heap = data if data else []
+        if self.heap:
+            self.build_heap()
+
+    def build_heap(self):
+        """Builds the heap from an unordered list in O(n)"""
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def _sift_up(self, i):
+        heap, d = self.heap, self.d
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not item < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            i = parent
+        heap[i] = item
+
+    def _sift_down(self, i):
+        heap, d = self.heap, self.d
+        n = len(heap)
+        item = heap[i]
+        first = d * i + 1
+        while first < n:
+            kids = heap[first:first + d]    # min/index scan the children in C
+            smallest = min(kids)
+            if not smallest < item:
+                break
+            heap[i] = smallest
+            i = first + kids.index(smallest)
+            first = d * i + 1
+        heap[i] = item
+
+    def insert(self, value):
+        self.heap.append(value)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        if not self.heap:
+            raise IndexError("Heap is empty")
+        root = self.heap[0]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self._sift_down(0)
         return root
 
     def peek(self):
-        """Returns the minimum element without removing it"""
         if not self.heap:
             return None
         return self.heap[0]
 
+    def meld(self, other):
+        """Moves every element of other into this heap (O(n + m) re-heapify)"""
+        self.heap.extend(other.heap)
+        other.heap = []
+        self.build_heap()
+
+    def __len__(self):
+        return len(self.heap)
+
     def __repr__(self):
-        return f"MinHeap({self.heap})"
-    
-    
-# Test heap functionality
-heap = MinHeap([9, 5, 6, 2, 3])
+        return f"DaryHeap(d={self.d}, {self.heap})"
+
+
+class _PairingNode:
+    """prev is the parent for a first child, else the left sibling."""
+    __slots__ = ("value", "child", "sibling", "prev")
+
+    def __init__(self, value):
+        self.value = value
+        self.child = self.sibling = self.prev = None
+
+
+class PairingHeap:
+    """
+    Pairing heap: a heap-ordered multiway tree. insert and meld just link
+    two roots (O(1)); pop pairs up the root's children left to right and
+    then folds them right to left (O(log n) amortized). insert returns the
+    node, which decrease_key accepts as a handle.
+    """
+
+    def __init__(self, data=None):
+        self.root = None
+        self._size = 0
+        for value in data or ():
+            self.insert(value)
+
+    @staticmethod
+    def _link(a, b):
+        """Makes the larger of two roots the first child of the smaller"""
+        if b.value < a.value:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def insert(self, value):
+        node = _PairingNode(value)
+        self.root = self._link(self.root, node) if self.root else node
+        self._size += 1
+        return node
+
+    def peek(self):
+        if not self.root:
+            return None
+        return self.root.value
+
+    def pop(self):
+        if not self.root:
+            raise IndexError("Heap is empty")
+        root = self.root
+        self.root = self._merge_pairs(root.child)
+        root.child = None
+        self._size -= 1
+        return root.value
+
+    def _merge_pairs(self, first):
+        link = self._link
+        pairs = []
+        while first:
+            a, b = first, first.sibling
+            a.prev = a.sibling = None
+            if not b:
+                pairs.append(a)
+                break
+            first = b.sibling
+            b.prev = b.sibling = None
+            pairs.append(link(a, b))
+        root = pairs.pop() if pairs else None
+        while pairs:
+            root = link(pairs.pop(), root)
+        return root
+
+    def decrease_key(self, node, value):
+        """Lowers the value of a node returned by insert"""
+        if value > node.value:
+            raise ValueError("decrease_key cannot raise a value")
+        node.value = value
+        if node is self.root:
+            return
+        # cut node's subtree out and link it back in at the root
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+        self.root = self._link(self.root, node)
+
+    def meld(self, other):
+        """Moves every element of other into this heap in O(1)"""
+        if other.root:
+            self.root = self._link(self.root, other.root) if self.root else other.root
+        self._size += other._size
+        other.root, other._size = None, 0
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"PairingHeap(len={self._size}, min={self.peek()!r})"
+
+
+if __name__ == "__main__":
+    # Test heap functionality
+    heap = MinHeap([9, 5, 6, 2, 3])
+
+    print("Initial Min Heap:", heap)
+
+    heap.insert(1)
+    print("After inserting 1:", heap)
+
+    print("Minimum element (peek):", heap.peek())
 
-print("Initial Min Heap:", heap)
+    print("Extract min:", heap.pop())
+    print("Heap after pop:", heap)
 
-heap.insert(1)
-print("After inserting 1:", heap)
+    print("Extract min again:", heap.pop())
+    print("Heap after second pop:", heap)
 
-print("Minimum element (peek):", heap.peek())
+    heap.insert(4)
+    print("After inserting 4:", heap)
 
-print("Extract min:", heap.pop())
-print("Heap after pop:", heap)
+    heap.insert(0)
+    print("After inserting 0:", heap)
 
-print("Extract min again:", heap.pop())
-print("Heap after second pop:", heap)
+    print("Extract min (final test):", heap.pop())
+    print("Heap after final pop:", heap)
 
-heap.insert(4)
-print("After inserting 4:", heap)
+    # Indexed heap: decrease-key and remove by item
+    pq = IndexedMinHeap([("a", 5), ("b", 3), ("c", 8)])
+    pq.decrease_key("c", 1)
+    print("After decrease_key(c, 1):", pq)
+    print("Remove b (priority):", pq.remove("b"))
+    print("Contains b:", "b" in pq)
+    print("Pop order:", [pq.pop() for _ in range(len(pq))])
 
-heap.insert(0)
-print("After inserting 0:", heap)
+    # Key functions, fused operations and bulk loading
+    tasks = MinHeap([("write", 3), ("read", 1), ("sync", 2)], key=lambda t: t[1])
+    print("Tasks by priority:", tasks.nsmallest(3))
+    print("pushpop(('noop', 0)):", tasks.pushpop(("noop", 0)))
+    print("replace(('scan', 5)):", tasks.replace(("scan", 5)))
+    floats = MinHeap([2.5, -1.0, 3.25])
+    floats.extend([0.5, 1e-9, -7.75, 4.0])
+    print("Floats after extend:", [floats.pop() for _ in range(len(floats))])
 
-print("Extract min (final test):", heap.pop())
-print("Heap after final pop:", heap)
+    # d-ary and pairing heaps share insert/pop/peek and can meld
+    quad = DaryHeap(4, [9, 5, 6, 2, 3, 8, 7])
+    quad.meld(DaryHeap(4, [4, 1]))
+    print("4-ary heap after meld:", quad)
+    pairing = PairingHeap([9, 5, 6])
+    node = pairing.insert(7)
+    pairing.decrease_key(node, 0)
+    pairing.meld(PairingHeap([2.5, 8]))
+    print("Pairing heap pop order:", [pairing.pop() for _ in range(len(pairing))])